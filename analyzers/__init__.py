@@ -5,9 +5,11 @@ Analyzers package
 from .relative_valuation import RelativeValuator, add_relative_valuation
 from .dcf_calculator import DCFCalculator, auto_dcf_valuation
 from .backtester import SimpleBacktester, value_strategy, quality_strategy, growth_strategy, STRATEGIES
+from .screener import screen_stocks
 
 __all__ = [
     'RelativeValuator', 'add_relative_valuation',
     'DCFCalculator', 'auto_dcf_valuation',
-    'SimpleBacktester', 'value_strategy', 'quality_strategy', 'growth_strategy', 'STRATEGIES'
+    'SimpleBacktester', 'value_strategy', 'quality_strategy', 'growth_strategy', 'STRATEGIES',
+    'screen_stocks'
 ]
@@ -6,10 +6,22 @@
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Callable, Optional
+import operator
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Callable, Optional, Tuple
 from datetime import datetime, date
 import logging
 
+try:
+    import numexpr  # noqa: F401
+    HAS_NUMEXPR = True
+except ImportError:
+    HAS_NUMEXPR = False
+
+from utils.jit import njit, HAS_NUMBA
+
 logger = logging.getLogger("kr_stock_collector.backtester")
 
 
@@ -25,6 +37,104 @@ class SimpleBacktester:
         self.initial_capital = initial_capital
         self.max_positions = max_positions
         self.rebalance_freq = rebalance_freq
+        
+        # 연도별 수익률 조회 배열 캐시 (historical_data, {year: (codes, returns)})
+        self._prepared = None
+    
+    def _prepare(
+        self,
+        historical_data: Dict[str, pd.DataFrame],
+        year: str
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        연도별 (정렬된 종목코드 배열, 수익률 배열) 조회
+        
+        DataFrame 대신 배열 쌍(SoA)으로 변환해 두고 np.searchsorted로 조회한다.
+        동일한 historical_data 객체로 반복 실행(파라미터 탐색 등)하면
+        연도별로 한 번만 생성한 배열을 재사용한다.
+        """
+        cache = self._prepared[1]
+        if year not in cache:
+            df = historical_data[year]
+            code_col = '종목코드' if '종목코드' in df.columns else 'stock_code'
+            
+            if 'return' in df.columns and code_col in df.columns:
+                codes = df[code_col].to_numpy().astype(str)
+                # 안정 정렬 후 중복 코드는 첫 번째 행만 유지
+                order = np.argsort(codes, kind='stable')
+                codes = codes[order]
+                first = np.ones(len(codes), dtype=bool)
+                first[1:] = codes[1:] != codes[:-1]
+                returns = df['return'].to_numpy(dtype=np.float64)[order]
+                cache[year] = (codes[first], returns[first])
+            else:
+                cache[year] = None
+        
+        return cache[year]
+    
+    @staticmethod
+    def _lookup_returns(prepared: Tuple[np.ndarray, np.ndarray], holdings: List[str]) -> np.ndarray:
+        """보유 종목의 수익률 (보유 순서 유지, 없는 종목/결측값 제외)"""
+        codes, returns = prepared
+        if not holdings or not len(codes):
+            return np.empty(0)
+        
+        keys = np.asarray(holdings).astype(str)
+        idx = np.searchsorted(codes, keys)
+        idx[idx == len(codes)] = 0
+        found = returns[idx][codes[idx] == keys]
+        return found[~np.isnan(found)]
+    
+    def _run_one_year(
+        self,
+        screening_func: Callable[[pd.DataFrame], pd.DataFrame],
+        historical_data: Dict[str, pd.DataFrame],
+        year: int
+    ) -> Optional[Tuple[float, List[str]]]:
+        """
+        단일 연도 스크리닝 + 다음 연도 수익률 계산
+        
+        Returns:
+            (평균 수익률, 보유 종목코드) - 데이터/선택 종목이 없으면 None
+        """
+        if str(year) not in historical_data:
+            logger.warning(f"데이터 없음: {year}년")
+            return None
+        
+        year_data = historical_data[str(year)]
+        
+        # 스크리닝
+        try:
+            selected = screening_func(year_data)
+            if selected is None or selected.empty:
+                logger.warning(f"{year}년 선택 종목 없음")
+                return None
+            
+            # 상위 N개 선택
+            selected = selected.head(self.max_positions)
+            holdings = selected['종목코드'].tolist() if '종목코드' in selected.columns else []
+        
+        except Exception as e:
+            logger.error(f"{year}년 스크리닝 오류: {e}")
+            return None
+        
+        # 다음 연도 수익률 계산
+        next_year = str(year + 1)
+        if next_year not in historical_data:
+            return None
+        
+        # 수익률 계산 (단순 평균) - 정렬된 종목코드 배열에서 이진 탐색
+        prepared = self._prepare(historical_data, next_year)
+        returns = np.empty(0)
+        if prepared is not None:
+            returns = self._lookup_returns(prepared, holdings)
+        
+        if returns.size:
+            avg_return = np.mean(returns)
+        else:
+            avg_return = 0
+        
+        return avg_return, holdings
     
     def run(
         self,
@@ -36,6 +146,9 @@ class SimpleBacktester:
         """
         백테스트 실행
         
+        연도별 스크리닝은 서로 독립이므로 스레드 풀로 동시에 처리하고
+        (numpy/numba 연산은 GIL을 해제), 누적 수익률은 마지막에 한 번에 계산한다.
+        
         Args:
             screening_func: 스크리닝 함수 (DataFrame → 선택된 종목 DataFrame)
             historical_data: {year: DataFrame} 각 연도별 재무/주가 데이터
@@ -52,114 +165,228 @@ class SimpleBacktester:
             'cumulative': [1.0]
         }
         
-        for year in range(start_year, end_year):
-            if str(year) not in historical_data:
-                logger.warning(f"데이터 없음: {year}년")
-                continue
-            
-            year_data = historical_data[str(year)]
-            
-            # 스크리닝
-            try:
-                selected = screening_func(year_data)
-                if selected is None or selected.empty:
-                    logger.warning(f"{year}년 선택 종목 없음")
-                    continue
-                
-                # 상위 N개 선택
-                selected = selected.head(self.max_positions)
-                holdings = selected['종목코드'].tolist() if '종목코드' in selected.columns else []
-                
-            except Exception as e:
-                logger.error(f"{year}년 스크리닝 오류: {e}")
-                continue
-            
-            # 다음 연도 수익률 계산
-            next_year = str(year + 1)
-            if next_year not in historical_data:
+        if self._prepared is None or self._prepared[0] is not historical_data:
+            self._prepared = (historical_data, {})
+        
+        years = list(range(start_year, end_year))
+        if not years:
+            return results
+        
+        with ThreadPoolExecutor(max_workers=min(os.cpu_count() or 1, len(years))) as pool:
+            outcomes = list(pool.map(
+                lambda year: self._run_one_year(screening_func, historical_data, year),
+                years
+            ))
+        
+        for year, outcome in zip(years, outcomes):
+            if outcome is None:
                 continue
-            
-            next_data = historical_data[next_year]
-            
-            # 수익률 계산 (단순 평균)
-            returns = []
-            for code in holdings:
-                code_col = '종목코드' if '종목코드' in next_data.columns else 'stock_code'
-                stock = next_data[next_data[code_col] == code]
-                
-                if not stock.empty and 'return' in stock.columns:
-                    returns.append(stock['return'].iloc[0])
-            
-            if returns:
-                avg_return = np.mean(returns)
-            else:
-                avg_return = 0
-            
+            avg_return, holdings = outcome
             results['years'].append(year)
             results['returns'].append(avg_return)
             results['holdings'].append(holdings)
-            results['cumulative'].append(
-                results['cumulative'][-1] * (1 + avg_return)
-            )
         
-        # 성과 지표 계산
-        if results['returns']:
-            results['total_return'] = (results['cumulative'][-1] - 1) * 100
-            results['annual_return'] = np.mean(results['returns']) * 100
-            results['volatility'] = np.std(results['returns']) * 100
-            results['sharpe_ratio'] = (
-                np.mean(results['returns']) / np.std(results['returns'])
-                if np.std(results['returns']) > 0 else 0
-            )
-            results['max_drawdown'] = self._calculate_mdd(results['cumulative'])
-            results['win_rate'] = sum(1 for r in results['returns'] if r > 0) / len(results['returns']) * 100
+        returns_arr = np.asarray(results['returns'], dtype=np.float64)
+        
+        # 누적 수익률 곡선
+        cumulative = np.concatenate(([1.0], np.cumprod(1 + returns_arr)))
+        results['cumulative'] = cumulative.tolist()
+        
+        # 성과 지표 계산 (수익률 배열 기준 벡터 연산)
+        if returns_arr.size:
+            mean = returns_arr.mean()
+            std = returns_arr.std()
+            results['total_return'] = (cumulative[-1] - 1) * 100
+            results['annual_return'] = mean * 100
+            results['volatility'] = std * 100
+            results['sharpe_ratio'] = mean / std if std > 0 else 0
+            results['max_drawdown'] = self._calculate_mdd(cumulative)
+            results['win_rate'] = (returns_arr > 0).mean() * 100
         
         return results
     
-    def _calculate_mdd(self, cumulative: list) -> float:
+    def _calculate_mdd(self, cumulative: np.ndarray) -> float:
         """최대 낙폭 계산"""
-        peak = cumulative[0]
-        max_dd = 0
+        values = np.asarray(cumulative, dtype=np.float64)
         
-        for value in cumulative:
-            if value > peak:
-                peak = value
-            dd = (peak - value) / peak
-            if dd > max_dd:
-                max_dd = dd
+        if HAS_NUMBA:
+            max_dd = _mdd_nb(values)
+        else:
+            peak = np.maximum.accumulate(values)
+            max_dd = ((peak - values) / peak).max()
         
         return max_dd * 100
 
 
-def value_strategy(df: pd.DataFrame) -> pd.DataFrame:
-    """그레이엄 스타일 가치투자 전략"""
-    if df is None or df.empty:
-        return pd.DataFrame()
+@njit(cache=True)
+def _mdd_nb(cumulative: np.ndarray) -> float:
+    """최대 낙폭 계산 커널 (비율)"""
+    peak = cumulative[0]
+    max_dd = 0.0
+    
+    for value in cumulative:
+        if value > peak:
+            peak = value
+        dd = (peak - value) / peak
+        if dd > max_dd:
+            max_dd = dd
+    
+    return max_dd
+
+
+# 전략별 필터 조건: (컬럼, 연산자, 기준값) - 데이터에 있는 컬럼만 적용
+VALUE_FILTERS = (
+    ('PER', '>', 0), ('PER', '<', 15),
+    ('PBR', '>', 0), ('PBR', '<', 1.5),
+    ('ROE(%)', '>', 10),
+    ('부채비율(%)', '<', 100),
+)
+
+QUALITY_FILTERS = (
+    ('ROE(%)', '>', 15),
+    ('ROIC(%)', '>', 12),
+    ('영업이익률(%)', '>', 10),
+    ('OCF/순이익', '>', 0.8),
+)
+
+GROWTH_FILTERS = (
+    ('매출성장률(%)', '>', 15),
+    ('영업이익성장률(%)', '>', 15),
+    ('PEG', '<', 1.5),
+)
+
+_OPERATORS = {
+    '>': operator.gt,
+    '<': operator.lt,
+    '>=': operator.ge,
+    '<=': operator.le,
+}
+
+# compile_predicate 커널용 연산자 코드
+_OP_CODES = {'>': 0, '<': 1, '>=': 2, '<=': 3}
+
+
+@njit(nogil=True, cache=True)
+def _predicate_nb(
+    matrix: np.ndarray,
+    col_idx: np.ndarray,
+    op_codes: np.ndarray,
+    thresholds: np.ndarray
+) -> np.ndarray:
+    """
+    행 단위 필터 커널 (모든 조건을 만족하면 True, NaN은 False)
+    
+    연도 단위로 스레드 병렬 실행되므로 행 병렬화(prange) 대신 GIL만 해제한다.
+    """
+    n_rows = matrix.shape[0]
+    mask = np.ones(n_rows, dtype=np.bool_)
+    
+    for i in range(n_rows):
+        for k in range(col_idx.shape[0]):
+            value = matrix[i, col_idx[k]]
+            op = op_codes[k]
+            if op == 0:
+                ok = value > thresholds[k]
+            elif op == 1:
+                ok = value < thresholds[k]
+            elif op == 2:
+                ok = value >= thresholds[k]
+            else:
+                ok = value <= thresholds[k]
+            if not ok:
+                mask[i] = False
+                break
+    
+    return mask
+
+
+def compile_predicate(spec: Tuple[Tuple[str, str, float], ...]) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    (컬럼, 연산자, 기준값) 조건 목록을 행렬 → bool 마스크 함수로 컴파일
+    
+    반환 함수는 predicate.columns 순서로 뽑은 2차원 float64 행렬을 받는다.
+    커널은 조건 내용과 무관하게 한 번만 JIT 컴파일되므로 연도/전략이 바뀌어도 재사용된다.
+    
+    Example:
+        predicate = compile_predicate(VALUE_FILTERS)
+        mask = predicate(df[list(predicate.columns)].to_numpy(dtype=np.float64))
+    """
+    columns = tuple(dict.fromkeys(col for col, _, _ in spec))
+    col_idx = np.array([columns.index(col) for col, _, _ in spec], dtype=np.int64)
+    op_codes = np.array([_OP_CODES[op] for _, op, _ in spec], dtype=np.int64)
+    thresholds = np.array([value for _, _, value in spec], dtype=np.float64)
     
-    result = df.copy()
+    def predicate(matrix: np.ndarray) -> np.ndarray:
+        return _predicate_nb(np.ascontiguousarray(matrix, dtype=np.float64), col_idx, op_codes, thresholds)
     
-    # 필터 조건
-    conditions = pd.Series([True] * len(result))
+    predicate.columns = columns
+    return predicate
+
+
+@lru_cache(maxsize=64)
+def _applicable_filters(
+    columns: Tuple[str, ...],
+    filters: Tuple[Tuple[str, str, float], ...]
+) -> Tuple[Tuple[Tuple[str, str, float], ...], Tuple[str, ...], str]:
+    """
+    컬럼 구성별 적용 가능한 필터, 사용 컬럼, eval 식 (스키마가 같으면 재사용)
     
-    if 'PER' in result.columns:
-        conditions &= (result['PER'] > 0) & (result['PER'] < 15)
+    한글/특수문자 컬럼명은 식에 쓸 수 없으므로 c0, c1 ... 별칭으로 치환한다.
+    """
+    available = set(columns)
+    applicable = tuple(f for f in filters if f[0] in available)
+    used = tuple(dict.fromkeys(col for col, _, _ in applicable))
+    alias = {col: f"c{i}" for i, col in enumerate(used)}
+    expr = ' & '.join(f"({alias[col]} {op} {value!r})" for col, op, value in applicable)
+    return applicable, used, expr
+
+
+@lru_cache(maxsize=64)
+def _compiled_filters(applicable: Tuple[Tuple[str, str, float], ...]) -> Callable[[np.ndarray], np.ndarray]:
+    """적용 가능한 필터 조합별 컴파일된 predicate (백테스트 연도 간 재사용)"""
+    return compile_predicate(applicable)
+
+
+def _apply_filters(df: pd.DataFrame, filters: Tuple[Tuple[str, str, float], ...]) -> pd.DataFrame:
+    """
+    필터 조건 일괄 적용
     
-    if 'PBR' in result.columns:
-        conditions &= (result['PBR'] > 0) & (result['PBR'] < 1.5)
+    numba가 있으면 컴파일된 predicate 커널로, numexpr가 있으면 하나의 식으로 묶어
+    원본 배열 위에서 한 번에 평가하고, 둘 다 없으면 조건별 마스크를 누적한다.
+    """
+    applicable, used, expr = _applicable_filters(tuple(df.columns), filters)
+    if not applicable:
+        return df
     
-    if 'ROE(%)' in result.columns:
-        conditions &= (result['ROE(%)'] > 10)
+    if HAS_NUMBA:
+        predicate = _compiled_filters(applicable)
+        return df[predicate(df[list(used)].to_numpy(dtype=np.float64))]
     
-    if '부채비율(%)' in result.columns:
-        conditions &= (result['부채비율(%)'] < 100)
+    if HAS_NUMEXPR:
+        local_dict = {f"c{i}": df[col].to_numpy() for i, col in enumerate(used)}
+        mask = pd.eval(expr, local_dict=local_dict, engine='numexpr')
+        return df[np.asarray(mask, dtype=bool)]
     
-    filtered = result[conditions]
+    mask = np.ones(len(df), dtype=bool)
+    for col, op, value in applicable:
+        mask &= _OPERATORS[op](df[col].to_numpy(), value)
+    
+    return df[mask]
+
+
+def value_strategy(df: pd.DataFrame) -> pd.DataFrame:
+    """그레이엄 스타일 가치투자 전략"""
+    if df is None or df.empty:
+        return pd.DataFrame()
+    
+    # 필터 조건 (입력 프레임은 수정하지 않으므로 복사 없이 사용)
+    filtered = _apply_filters(df, VALUE_FILTERS)
     
     # PER + PBR 순위로 정렬
     if 'PER' in filtered.columns and 'PBR' in filtered.columns:
-        filtered = filtered.copy()
-        filtered['composite_rank'] = filtered['PER'].rank() + filtered['PBR'].rank()
-        filtered = filtered.sort_values('composite_rank')
+        filtered = filtered.assign(
+            composite_rank=filtered['PER'].rank() + filtered['PBR'].rank()
+        ).sort_values('composite_rank')
     
     return filtered
 
@@ -169,23 +396,7 @@ def quality_strategy(df: pd.DataFrame) -> pd.DataFrame:
     if df is None or df.empty:
         return pd.DataFrame()
     
-    result = df.copy()
-    
-    conditions = pd.Series([True] * len(result))
-    
-    if 'ROE(%)' in result.columns:
-        conditions &= (result['ROE(%)'] > 15)
-    
-    if 'ROIC(%)' in result.columns:
-        conditions &= (result['ROIC(%)'] > 12)
-    
-    if '영업이익률(%)' in result.columns:
-        conditions &= (result['영업이익률(%)'] > 10)
-    
-    if 'OCF/순이익' in result.columns:
-        conditions &= (result['OCF/순이익'] > 0.8)
-    
-    filtered = result[conditions]
+    filtered = _apply_filters(df, QUALITY_FILTERS)
     
     if 'ROE(%)' in filtered.columns:
         filtered = filtered.sort_values('ROE(%)', ascending=False)
@@ -198,22 +409,13 @@ def growth_strategy(df: pd.DataFrame) -> pd.DataFrame:
     if df is None or df.empty:
         return pd.DataFrame()
     
-    result = df.copy()
-    
-    conditions = pd.Series([True] * len(result))
-    
-    if '매출성장률(%)' in result.columns:
-        conditions &= (result['매출성장률(%)'] > 15)
-    
-    if '영업이익성장률(%)' in result.columns:
-        conditions &= (result['영업이익성장률(%)'] > 15)
+    result = df
     
     if 'PER' in result.columns and '순이익성장률(%)' in result.columns:
-        # PEG < 1
-        result['PEG'] = result['PER'] / result['순이익성장률(%)'].clip(lower=1)
-        conditions &= (result['PEG'] < 1.5)
+        # PEG < 1 (새 컬럼만 붙인 프레임 생성)
+        result = result.assign(PEG=result['PER'] / result['순이익성장률(%)'].clip(lower=1))
     
-    filtered = result[conditions]
+    filtered = _apply_filters(result, GROWTH_FILTERS)
     
     if '매출성장률(%)' in filtered.columns:
         filtered = filtered.sort_values('매출성장률(%)', ascending=False)
@@ -7,12 +7,66 @@ DCF 자동 계산 모듈 (v2.0)
 
 import pandas as pd
 import numpy as np
+from functools import lru_cache
 from typing import Dict, Optional, Tuple
 import logging
 
+from utils.jit import njit
+
 logger = logging.getLogger("kr_stock_collector.dcf")
 
 
+@njit(cache=True)
+def _project_fcf_nb(
+    base_fcf: float,
+    growth_phase1: float,
+    growth_phase2: float,
+    years: int
+) -> np.ndarray:
+    """FCF 성장 추정 커널 (1~5년 phase1, 이후 phase2)"""
+    projections = np.empty(years)
+    current_fcf = base_fcf
+    
+    for year in range(1, years + 1):
+        if year <= 5:
+            growth = growth_phase1
+        else:
+            growth = growth_phase2
+        
+        current_fcf = current_fcf * (1 + growth)
+        projections[year - 1] = current_fcf
+    
+    return projections
+
+
+def _discount_factors(discount_rate: float, periods: int) -> np.ndarray:
+    """1~n기 할인계수 벡터 (1+r)^-t"""
+    return np.power(1 + discount_rate, -np.arange(1, periods + 1, dtype=np.float64))
+
+
+@lru_cache(maxsize=4096)
+def _estimate_growth_rate(historical_fcf: Tuple[float, ...], method: str) -> float:
+    """과거 FCF 성장률 추정 (동일한 FCF 이력은 캐시 재사용)"""
+    fcf = np.array(
+        [np.nan if f is None else f for f in historical_fcf],
+        dtype=np.float64
+    )
+    
+    # 양수 값만 사용 (None/NaN/0/음수 제외)
+    fcf = fcf[fcf > 0]
+    if fcf.size < 2:
+        return 0.05
+    
+    if method == 'cagr':
+        # CAGR 계산
+        rate = (fcf[-1] / fcf[0]) ** (1 / (fcf.size - 1)) - 1
+    else:
+        # 평균 성장률 (전년 대비 성장률의 중앙값)
+        rate = np.median(np.diff(fcf) / fcf[:-1])
+    
+    return float(max(min(rate, 0.30), -0.10))  # -10% ~ 30% 제한
+
+
 class DCFCalculator:
     """DCF 자동 계산기"""
     
@@ -46,32 +100,7 @@ class DCFCalculator:
         if not historical_fcf or len(historical_fcf) < 2:
             return 0.05  # 기본값 5%
         
-        # 양수 값만 사용
-        positive_fcf = [f for f in historical_fcf if f and f > 0]
-        if len(positive_fcf) < 2:
-            return 0.05
-        
-        if method == 'cagr':
-            # CAGR 계산
-            start = positive_fcf[0]
-            end = positive_fcf[-1]
-            years = len(positive_fcf) - 1
-            
-            if start > 0 and end > 0:
-                cagr = (end / start) ** (1 / years) - 1
-                return max(min(cagr, 0.30), -0.10)  # -10% ~ 30% 제한
-        
-        # 평균 성장률
-        growth_rates = []
-        for i in range(1, len(positive_fcf)):
-            if positive_fcf[i-1] > 0:
-                rate = (positive_fcf[i] - positive_fcf[i-1]) / positive_fcf[i-1]
-                growth_rates.append(rate)
-        
-        if growth_rates:
-            return max(min(np.median(growth_rates), 0.30), -0.10)
-        
-        return 0.05
+        return _estimate_growth_rate(tuple(historical_fcf), method)
     
     def project_fcf(
         self,
@@ -81,26 +110,14 @@ class DCFCalculator:
         years: int = 10
     ) -> list:
         """FCF 성장 추정"""
-        fcf_projections = []
-        current_fcf = base_fcf
-        
-        for year in range(1, years + 1):
-            if year <= 5:
-                growth = growth_phase1
-            else:
-                growth = growth_phase2
-            
-            current_fcf = current_fcf * (1 + growth)
-            fcf_projections.append(current_fcf)
-        
-        return fcf_projections
+        return _project_fcf_nb(
+            float(base_fcf), float(growth_phase1), float(growth_phase2), int(years)
+        ).tolist()
     
     def calculate_pv(self, cash_flows: list, discount_rate: float) -> float:
         """현재가치 계산"""
-        pv = 0
-        for i, cf in enumerate(cash_flows, 1):
-            pv += cf / ((1 + discount_rate) ** i)
-        return pv
+        cash_flows = np.asarray(cash_flows, dtype=np.float64)
+        return float(cash_flows @ _discount_factors(discount_rate, cash_flows.size))
     
     def calculate_terminal_value(
         self,
@@ -221,28 +238,40 @@ class DCFCalculator:
         wacc_values = np.linspace(wacc_range[0], wacc_range[1], 5)
         growth_values = np.linspace(growth_range[0], growth_range[1], 5)
         
-        results = []
-        for wacc in wacc_values:
-            for g in growth_values:
-                fv = self.calculate_fair_value(
-                    base_fcf, net_debt, shares_outstanding,
-                    wacc=wacc, growth_phase2=g
+        n = self.projection_years
+        
+        if base_fcf > 0 and shares_outstanding > 0:
+            # FCF 추정: (성장률 5,) × (연도 n,) - 1~5년은 10%, 이후 민감도 성장률
+            years = np.arange(1, n + 1)
+            rates = np.where(years[None, :] <= 5, 0.10, growth_values[:, None])
+            projections = base_fcf * np.cumprod(1 + rates, axis=1)
+            
+            # 할인계수: (WACC 5,) × (연도 n,)
+            disc = np.power(1 + wacc_values[:, None], -years[None, :].astype(np.float64))
+            dcf_value = disc @ projections.T
+            
+            # 영구가치 (Gordon Growth, WACC <= g 이면 0)
+            terminal_growth = self.terminal_growth
+            spread = wacc_values[:, None] - terminal_growth
+            with np.errstate(divide='ignore', invalid='ignore'):
+                terminal_value = np.where(
+                    spread > 0,
+                    projections[None, :, -1] * (1 + terminal_growth) / spread,
+                    0.0
                 )
-                results.append({
-                    'WACC': f"{wacc:.1%}",
-                    'Terminal_Growth': f"{g:.1%}",
-                    'Fair_Value': fv.get('fair_value', 0)
-                })
+            terminal_pv = terminal_value * disc[:, -1:]
+            
+            equity_value = dcf_value + terminal_pv - net_debt
+            fv_grid = np.round((equity_value * 100_000_000) / shares_outstanding, 0)
+        else:
+            fv_grid = np.full((len(wacc_values), len(growth_values)), None, dtype=object)
         
-        df = pd.DataFrame(results)
-        # 피벗 테이블로 변환
-        pivot = df.pivot(
-            index='WACC',
-            columns='Terminal_Growth',
-            values='Fair_Value'
+        # 라벨은 반환 시점에만 부여 (WACC/성장률 오름차순)
+        return pd.DataFrame(
+            fv_grid,
+            index=pd.Index([f"{w:.1%}" for w in wacc_values], name='WACC'),
+            columns=pd.Index([f"{g:.1%}" for g in growth_values], name='Terminal_Growth')
         )
-        
-        return pivot
 
 
 def auto_dcf_valuation(financial_data: Dict, market_data: Dict = None) -> Dict:
@@ -7,9 +7,15 @@
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import logging
 
+try:
+    import polars as pl
+    HAS_POLARS = True
+except ImportError:
+    HAS_POLARS = False
+
 logger = logging.getLogger("kr_stock_collector.relative_valuation")
 
 
@@ -40,9 +46,43 @@ class RelativeValuator:
         '부채비율(%)', '매출성장률(%)'
     ]
     
+    # 상대가치 계산 대상: (지표, 낮을수록 좋음 여부, 섹터 프리미엄 계산 여부)
+    RELATIVE_METRICS = [
+        # PER, PBR, PSR, EV/EBITDA: 낮을수록 좋음
+        ('PER', True, True),
+        ('PBR', True, True),
+        ('PSR', True, True),
+        ('EV/EBITDA', True, True),
+        # ROE, ROA, ROIC, 이익률: 높을수록 좋음
+        ('ROE(%)', False, True),
+        ('ROA(%)', False, True),
+        ('ROIC(%)', False, True),
+        ('영업이익률(%)', False, True),
+        ('순이익률(%)', False, True),
+        ('매출성장률(%)', False, True),
+        # 부채비율: 낮을수록 좋음
+        ('부채비율(%)', True, False),
+    ]
+    
     def __init__(self):
         pass
     
+    @classmethod
+    def downcast_metrics(cls, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        밸류에이션 지표 컬럼을 float32로 변환 (선택 사항)
+        
+        재무비율은 유효숫자 4~6자리면 충분하므로, 대량 데이터에서 groupby/rank 연산의
+        메모리 대역폭을 절반으로 줄인다. 프리미엄(%) 등 파생 값은 float32 정밀도로 계산된다.
+        """
+        columns = [
+            col for col in cls.VALUATION_METRICS
+            if col in df.columns and df[col].dtype == np.float64
+        ]
+        if not columns:
+            return df
+        return df.astype({col: np.float32 for col in columns})
+    
     def calculate_sector_stats(self, df: pd.DataFrame, metric: str) -> pd.DataFrame:
         """섹터별 통계 계산"""
         if 'sector' not in df.columns or metric not in df.columns:
@@ -73,19 +113,18 @@ class RelativeValuator:
         if 'sector' not in df.columns or metric not in df.columns:
             return df
         
-        result = df.copy()
-        
-        # 섹터 내 순위 (%)
-        result[f'{metric}_섹터순위%'] = result.groupby('sector')[metric].rank(
-            pct=True, ascending=ascending, na_option='bottom'
-        )
-        
-        # 섹터 내 절대순위
-        result[f'{metric}_섹터순위'] = result.groupby('sector')[metric].rank(
-            ascending=ascending, na_option='bottom'
-        ).astype(int)
+        grouped = df.groupby('sector')[metric]
         
-        return result
+        return df.assign(**{
+            # 섹터 내 순위 (%)
+            f'{metric}_섹터순위%': grouped.rank(
+                pct=True, ascending=ascending, na_option='bottom'
+            ),
+            # 섹터 내 절대순위
+            f'{metric}_섹터순위': grouped.rank(
+                ascending=ascending, na_option='bottom'
+            ).astype(int),
+        })
     
     def calculate_sector_premium(self, df: pd.DataFrame, metric: str) -> pd.DataFrame:
         """
@@ -98,39 +137,92 @@ class RelativeValuator:
         if 'sector' not in df.columns or metric not in df.columns:
             return df
         
-        result = df.copy()
-        
         # 섹터별 중앙값
-        sector_median = result.groupby('sector')[metric].transform('median')
+        sector_median = df.groupby('sector')[metric].transform('median')
         
         # 프리미엄 계산 (%)
-        result[f'{metric}_섹터프리미엄%'] = (
-            (result[metric] - sector_median) / sector_median * 100
-        ).round(2)
-        
-        return result
+        return df.assign(**{
+            f'{metric}_섹터프리미엄%': ((df[metric] - sector_median) / sector_median * 100).round(2)
+        })
     
     def add_all_relative_metrics(self, df: pd.DataFrame) -> pd.DataFrame:
         """모든 상대가치 지표 추가"""
-        result = df.copy()
+        metrics = [
+            (metric, ascending, premium)
+            for metric, ascending, premium in self.RELATIVE_METRICS
+            if metric in df.columns
+        ]
+        if 'sector' not in df.columns or not metrics:
+            return df
         
-        # PER, PBR, PSR, EV/EBITDA: 낮을수록 좋음
-        for metric in ['PER', 'PBR', 'PSR', 'EV/EBITDA']:
-            if metric in result.columns:
-                result = self.calculate_sector_rank(result, metric, ascending=True)
-                result = self.calculate_sector_premium(result, metric)
+        if HAS_POLARS:
+            sector_rank, sector_size, sector_median = self._sector_stats_polars(df, metrics)
+        else:
+            # 높을수록 좋은 지표는 부호를 뒤집어 모든 지표를 한 번의 groupby rank로 처리
+            keys = pd.DataFrame(
+                {metric: df[metric] if ascending else -df[metric] for metric, ascending, _ in metrics},
+                index=df.index
+            )
+            grouped = keys.groupby(df['sector'], sort=False)
+            sector_rank = grouped.rank(na_option='bottom')
+            sector_size = grouped[metrics[0][0]].transform('size')
+            # 프리미엄 대상 지표의 섹터 중앙값도 한 번의 groupby transform으로 계산
+            premium_metrics = [metric for metric, _, premium in metrics if premium]
+            sector_median = (
+                df.groupby('sector', sort=False)[premium_metrics].transform('median')
+                if premium_metrics else {}
+            )
         
-        # ROE, ROA, ROIC, 이익률: 높을수록 좋음
-        for metric in ['ROE(%)', 'ROA(%)', 'ROIC(%)', '영업이익률(%)', '순이익률(%)', '매출성장률(%)']:
-            if metric in result.columns:
-                result = self.calculate_sector_rank(result, metric, ascending=False)
-                result = self.calculate_sector_premium(result, metric)
+        new_columns = {}
+        for metric, ascending, premium in metrics:
+            # 섹터 내 순위 (%) / 절대순위
+            new_columns[f'{metric}_섹터순위%'] = sector_rank[metric] / sector_size
+            new_columns[f'{metric}_섹터순위'] = sector_rank[metric].astype(int)
+            
+            if premium:
+                median = sector_median[metric]
+                new_columns[f'{metric}_섹터프리미엄%'] = (
+                    (df[metric] - median) / median * 100
+                ).round(2)
         
-        # 부채비율: 낮을수록 좋음
-        if '부채비율(%)' in result.columns:
-            result = self.calculate_sector_rank(result, '부채비율(%)', ascending=True)
+        result = df.drop(columns=[col for col in new_columns if col in df.columns])
+        return pd.concat([result, pd.DataFrame(new_columns, index=df.index)], axis=1)
+    
+    def _sector_stats_polars(self, df: pd.DataFrame, metrics: List[Tuple[str, bool, bool]]):
+        """
+        섹터 내 순위/종목수/중앙값을 Polars로 계산
         
-        return result
+        모든 지표의 over('sector') 식을 하나의 select로 묶어 병렬 group-by 한 번으로 처리.
+        결측값은 pandas의 na_option='bottom'과 같이 섹터 내 최하위 평균 순위를 부여한다.
+        """
+        columns = [metric for metric, _, _ in metrics]
+        frame = pl.from_pandas(df[['sector'] + columns].reset_index(drop=True))
+        
+        exprs = [pl.len().over('sector').alias('__size__')]
+        for metric, ascending, premium in metrics:
+            col = pl.col(metric)
+            valid_count = col.is_not_null().sum().over('sector')
+            null_count = col.is_null().sum().over('sector')
+            exprs.append(
+                pl.when(col.is_null())
+                .then(valid_count + (null_count + 1) / 2)
+                .otherwise(col.rank('average', descending=not ascending).over('sector'))
+                .cast(pl.Float64)
+                .alias(f'{metric}__rank')
+            )
+            if premium:
+                exprs.append(col.median().over('sector').alias(f'{metric}__median'))
+        
+        stats = frame.select(exprs).to_pandas()
+        stats.index = df.index
+        
+        sector_rank = pd.DataFrame(
+            {metric: stats[f'{metric}__rank'] for metric in columns}, index=df.index
+        )
+        sector_median = {
+            metric: stats[f'{metric}__median'] for metric, _, premium in metrics if premium
+        }
+        return sector_rank, stats['__size__'], sector_median
     
     def get_undervalued_in_sector(
         self,
@@ -143,16 +235,16 @@ class RelativeValuator:
         
         result = self.add_all_relative_metrics(df)
         
-        conditions = pd.Series([True] * len(result))
+        conditions = np.ones(len(result), dtype=bool)
         
         if sector:
-            conditions &= (result['sector'] == sector)
+            conditions &= (result['sector'] == sector).to_numpy()
         
         if 'PER_섹터순위%' in result.columns:
-            conditions &= (result['PER_섹터순위%'] <= per_percentile)
+            conditions &= result['PER_섹터순위%'].to_numpy() <= per_percentile
         
         if 'ROE(%)_섹터순위%' in result.columns:
-            conditions &= (result['ROE(%)_섹터순위%'] >= roe_percentile)
+            conditions &= result['ROE(%)_섹터순위%'].to_numpy() >= roe_percentile
         
         return result[conditions].sort_values('PER_섹터순위%')
     
@@ -161,44 +253,57 @@ class RelativeValuator:
         if 'sector' not in df.columns:
             return {}
         
-        report = {}
+        # 리포트 항목: (컬럼, 집계함수) - 데이터에 없는 컬럼은 None
+        report_items = {
+            'PER_중앙값': ('PER', 'median'),
+            'PBR_중앙값': ('PBR', 'median'),
+            'ROE_평균': ('ROE(%)', 'mean'),
+            '시총_합계': ('market_cap', 'sum'),
+        }
         
-        for sector in df['sector'].dropna().unique():
-            sector_df = df[df['sector'] == sector]
-            
-            report[sector] = {
-                '종목수': len(sector_df),
-                'PER_중앙값': sector_df['PER'].median() if 'PER' in sector_df.columns else None,
-                'PBR_중앙값': sector_df['PBR'].median() if 'PBR' in sector_df.columns else None,
-                'ROE_평균': sector_df['ROE(%)'].mean() if 'ROE(%)' in sector_df.columns else None,
-                '시총_합계': sector_df['market_cap'].sum() if 'market_cap' in sector_df.columns else None,
-            }
-        
-        return report
+        aggregations = {'종목수': ('sector', 'size')}
+        aggregations.update({
+            name: spec for name, spec in report_items.items() if spec[0] in df.columns
+        })
+        
+        # 섹터별 한 번의 group-by로 모든 항목 집계
+        stats = df.groupby('sector', sort=False).agg(**aggregations)
+        
+        return {
+            sector: {name: row.get(name) for name in ['종목수', *report_items]}
+            for sector, row in stats.to_dict('index').items()
+        }
 
 
-def add_relative_valuation(ratio_df: pd.DataFrame, stock_df: pd.DataFrame = None) -> pd.DataFrame:
+def add_relative_valuation(
+    ratio_df: pd.DataFrame,
+    stock_df: pd.DataFrame = None,
+    downcast: bool = False
+) -> pd.DataFrame:
     """
     재무비율 데이터에 섹터 상대가치 지표 추가
     
     Args:
         ratio_df: 재무비율 데이터
         stock_df: 종목 기본정보 (섹터 포함)
+        downcast: True면 지표 컬럼을 float32로 변환 후 계산 (메모리/속도 우선)
     """
     if ratio_df is None or ratio_df.empty:
         return ratio_df
     
-    result = ratio_df.copy()
+    result = ratio_df
     
-    # 섹터 정보 병합
+    # 섹터 정보 병합 (원본은 그대로 두고 새 컬럼만 붙인 프레임 생성)
     if stock_df is not None and 'sector' in stock_df.columns:
         code_col = '종목코드' if '종목코드' in result.columns else 'stock_code'
         if code_col in result.columns:
             sector_map = dict(zip(stock_df['Code'], stock_df['sector']))
-            result['sector'] = result[code_col].map(sector_map)
+            result = result.assign(sector=result[code_col].map(sector_map))
     
     # 상대가치 계산
     valuator = RelativeValuator()
+    if downcast:
+        result = valuator.downcast_metrics(result)
     result = valuator.add_all_relative_metrics(result)
     
     logger.info(f"상대가치 지표 추가 완료: {len(result)}개 종목")
@@ -0,0 +1,143 @@
+"""
+조건 스크리닝 모듈
+- 범위 조건 (최소/최대) 일괄 필터링
+- 정렬 기준 상위 N개 추출
+"""
+
+import pandas as pd
+import numpy as np
+from pandas.api.types import is_numeric_dtype
+from functools import lru_cache
+from typing import Dict, Optional, Tuple, Callable, Union
+import logging
+
+from .backtester import compile_predicate
+
+try:
+    import polars as pl
+    HAS_POLARS = True
+except ImportError:
+    HAS_POLARS = False
+
+logger = logging.getLogger("kr_stock_collector.screener")
+
+
+@lru_cache(maxsize=256)
+def _range_predicate(spec: Tuple[Tuple[str, str, float], ...]) -> Callable[[np.ndarray], np.ndarray]:
+    """범위 조건 조합별 컴파일된 predicate (요청 간 재사용)"""
+    return compile_predicate(spec)
+
+
+def screen_stocks(
+    df: pd.DataFrame,
+    ranges: Dict[str, Tuple[Optional[float], Optional[float]]],
+    sort_by: Optional[str] = None,
+    ascending: bool = False,
+    limit: Optional[int] = None
+) -> pd.DataFrame:
+    """
+    범위 조건 스크리닝 + 상위 N개 추출
+    
+    모든 조건을 하나의 컴파일된 커널로 한 번에 평가하고, 정렬은 전체 정렬 대신
+    np.argpartition으로 상위 limit개만 골라 정렬한다.
+    
+    Args:
+        df: 종목 데이터
+        ranges: {컬럼: (최소, 최대)} - None이면 해당 방향 조건 없음 (경계값 포함)
+        sort_by: 정렬 컬럼 (수치형 컬럼만 적용, 그 외는 무시 / 결측값은 항상 마지막)
+        ascending: 오름차순 여부
+        limit: 최대 반환 종목수
+    
+    Returns:
+        조건을 만족하는 종목 DataFrame
+    """
+    if df is None or df.empty:
+        return pd.DataFrame()
+    
+    spec = []
+    for col, (low, high) in ranges.items():
+        if low is not None:
+            spec.append((col, '>=', float(low)))
+        if high is not None:
+            spec.append((col, '<=', float(high)))
+    
+    idx = np.arange(len(df))
+    
+    if spec:
+        predicate = _range_predicate(tuple(spec))
+        # 데이터에 없는 컬럼은 결측값으로 간주 (조건 불충족)
+        matrix = np.column_stack([
+            df[col].to_numpy(dtype=np.float64) if col in df.columns else np.full(len(df), np.nan)
+            for col in predicate.columns
+        ])
+        idx = np.flatnonzero(predicate(matrix))
+    
+    if limit is None or limit > len(idx):
+        limit = len(idx)
+    limit = max(limit, 0)
+    
+    if sort_by and sort_by in df.columns and len(idx) and is_numeric_dtype(df[sort_by]):
+        keys = df[sort_by].to_numpy(dtype=np.float64)[idx]
+        if not ascending:
+            keys = -keys
+        keys[np.isnan(keys)] = np.inf
+        
+        if limit < len(idx):
+            # limit번째 값 이하만 후보로 남김 (동률은 원래 순서 유지)
+            kth = np.partition(keys, limit - 1)[limit - 1]
+            top = np.flatnonzero(keys <= kth)
+        else:
+            top = np.arange(len(idx))
+        idx = idx[top[np.argsort(keys[top], kind='stable')]]
+    
+    return df.iloc[idx[:limit]]
+
+
+def screen_stocks_polars(
+    frame: Union['pl.DataFrame', 'pl.LazyFrame'],
+    ranges: Dict[str, Tuple[Optional[float], Optional[float]]],
+    sort_by: Optional[str] = None,
+    ascending: bool = False,
+    limit: Optional[int] = None
+) -> 'pl.DataFrame':
+    """
+    screen_stocks의 Polars 버전 (DB → Arrow → Polars 경로용)
+    
+    pandas로 변환하지 않고 filter → sort → limit을 하나의 lazy 쿼리로 실행해
+    조건이 적용된 뒤에만 정렬/추출이 일어나도록 한다. 조건/정렬 규칙은 screen_stocks와 같다.
+    
+    Args:
+        frame: pl.DataFrame 또는 pl.LazyFrame (예: pl.read_database 결과)
+    """
+    lazy = frame.lazy()
+    schema = lazy.collect_schema() if hasattr(lazy, 'collect_schema') else lazy.schema
+    names = set(schema.names() if hasattr(schema, 'names') else schema)
+    
+    def numeric(col: str) -> 'pl.Expr':
+        # NaN은 결측값으로 취급 (pandas 경로와 동일하게 조건 불충족, 정렬 시 마지막)
+        return pl.col(col).cast(pl.Float64).fill_nan(None)
+    
+    conditions = []
+    for col, (low, high) in ranges.items():
+        if low is None and high is None:
+            continue
+        if col not in names:
+            # 데이터에 없는 컬럼은 결측값으로 간주 (조건 불충족)
+            conditions.append(pl.lit(False))
+            continue
+        if low is not None:
+            conditions.append(numeric(col) >= float(low))
+        if high is not None:
+            conditions.append(numeric(col) <= float(high))
+    
+    if conditions:
+        lazy = lazy.filter(pl.all_horizontal(conditions))
+    
+    # 수치형(불리언 포함) 컬럼만 정렬 - 문자열 컬럼은 Float64 캐스팅이 실패하므로 무시 (pandas 경로와 동일)
+    if sort_by and sort_by in names and (schema[sort_by].is_numeric() or schema[sort_by] == pl.Boolean):
+        lazy = lazy.sort(numeric(sort_by), descending=not ascending, nulls_last=True, maintain_order=True)
+    
+    if limit is not None:
+        lazy = lazy.limit(max(limit, 0))
+    
+    return lazy.collect()
@@ -57,14 +57,18 @@ async def calculate_dcf(request: DCFRequest):
 @router.post("/rim/calculate")
 async def calculate_rim(request: RIMRequest):
     """RIM 내재가치 계산"""
-    # RIM = BV + Σ(Residual Income / (1+r)^n)
-    excess_return = request.roe - request.cost_of_equity
-    rim_value = request.book_value
+    # RIM = BV + Σ(Residual Income / (1+r)^n), n = 1..10
+    # 잔여이익이 매년 동일하므로 등비급수 합(연금현가계수)으로 계산
+    years = 10
+    r = request.cost_of_equity
+    residual_income = request.book_value * (request.roe - r)
     
-    for year in range(1, 11):
-        residual_income = request.book_value * excess_return
-        pv = residual_income / ((1 + request.cost_of_equity) ** year)
-        rim_value += pv
+    if r == 0:
+        annuity_factor = years
+    else:
+        annuity_factor = (1 - (1 + r) ** -years) / r
+    
+    rim_value = request.book_value + residual_income * annuity_factor
     
     fair_value = (rim_value * 100_000_000) / request.shares
     
@@ -5,6 +5,9 @@ Screen Router - 스크리닝 API
 from fastapi import APIRouter
 from pydantic import BaseModel
 from typing import Optional, List
+import pandas as pd
+
+from utils.json_codec import json_response
 
 router = APIRouter()
 
@@ -57,16 +60,56 @@ class ScreeningResponse(BaseModel):
 @router.post("/run", response_model=ScreeningResponse)
 async def run_screening(request: ScreeningRequest):
     """커스텀 스크리닝 실행"""
-    # TODO: DB 연동 후 실제 스크리닝
+    from analyzers.screener import screen_stocks, screen_stocks_polars, HAS_POLARS
+    
+    # TODO: DB 연동 후 전 종목 데이터로 교체 (pl.read_database → screen_stocks_polars)
     sample = [
         {"code": "000660", "name": "SK하이닉스", "market": "KOSPI", "sector": "IT", "per": 8.2, "pbr": 1.1, "roe": 22.1, "score": 95},
         {"code": "005930", "name": "삼성전자", "market": "KOSPI", "sector": "IT", "per": 12.5, "pbr": 1.3, "roe": 15.2, "score": 88},
     ]
-    return {
-        "total": len(sample),
-        "strategy": "custom",
-        "items": sample
+    ranges = {
+        'per': (request.per_min, request.per_max),
+        'pbr': (request.pbr_min, request.pbr_max),
+        'roe': (request.roe_min, None),
+        'roa': (request.roa_min, None),
+        'debt_ratio': (None, request.debt_ratio_max),
+        'revenue_growth': (request.revenue_growth_min, None),
     }
+    
+    if HAS_POLARS:
+        import polars as pl
+        
+        universe = pl.DataFrame(sample)
+        if request.market:
+            universe = universe.filter(pl.col('market') == request.market)
+        if request.sector:
+            universe = universe.filter(pl.col('sector') == request.sector)
+        
+        result = screen_stocks_polars(
+            universe, ranges,
+            sort_by=request.sort_by, ascending=request.ascending, limit=request.limit
+        )
+        # 응답 모델 필드만 직렬화
+        items = result.select(list(ScreeningItem.model_fields)).to_dicts()
+    else:
+        universe = pd.DataFrame(sample)
+        if request.market:
+            universe = universe[universe['market'] == request.market]
+        if request.sector:
+            universe = universe[universe['sector'] == request.sector]
+        
+        result = screen_stocks(
+            universe, ranges,
+            sort_by=request.sort_by, ascending=request.ascending, limit=request.limit
+        )
+        result = result[list(ScreeningItem.model_fields)]
+        items = result.astype(object).where(result.notna(), None).to_dict('records')
+    
+    return json_response({
+        "total": len(items),
+        "strategy": "custom",
+        "items": items
+    })
 
 
 @router.get("/presets")
@@ -6,6 +6,8 @@ from fastapi import APIRouter, Query, HTTPException
 from typing import List, Optional
 from pydantic import BaseModel
 
+from utils.json_codec import json_response
+
 router = APIRouter()
 
 
@@ -36,7 +38,12 @@ async def get_stocks(
         {"code": "005930", "name": "삼성전자", "market": "KOSPI", "sector": "IT", "is_active": True},
         {"code": "000660", "name": "SK하이닉스", "market": "KOSPI", "sector": "IT", "is_active": True},
     ]
-    return {"total": len(sample), "items": sample}
+    # 응답 모델 필드만 직렬화 (없는 필드는 모델 기본값)
+    items = [
+        {field: row.get(field, info.default) for field, info in StockResponse.model_fields.items()}
+        for row in sample
+    ]
+    return json_response({"total": len(items), "items": items})
 
 
 @router.get("/{code}")
@@ -9,48 +9,104 @@ import asyncio
 import aiohttp
 from abc import ABC, abstractmethod
 from typing import List, Dict, Optional, Any
+from urllib.parse import urlsplit
 import logging
+import math
 from datetime import datetime
 import time
 
+from utils.json_codec import json_loads
+
+try:
+    import uvloop
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
 logger = logging.getLogger("kr_stock_collector.async_base")
 
+# 이 값보다 큰 대기 헤더는 초가 아니라 Unix epoch 시각으로 간주
+_EPOCH_THRESHOLD = 1e9
+
+
+def _header_seconds(value: Optional[str]) -> Optional[float]:
+    """
+    대기 시간 헤더 값을 초 단위로 변환 (해석 불가 시 None)
+    
+    epoch 시각(예: X-RateLimit-Reset=1760000000)은 현재 시각과의 차이로 바꾸고,
+    음수/NaN/무한대는 버린다.
+    """
+    if value is None:
+        return None
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        return None
+    if seconds > _EPOCH_THRESHOLD:
+        seconds -= time.time()
+    if not math.isfinite(seconds):
+        return None
+    return max(seconds, 0.0)
+
+
+def run_async(coro):
+    """
+    코루틴 동기 실행 (asyncio.run 대체)
+    
+    uvloop 설치 시 libuv 기반 이벤트 루프로 실행한다 (소켓 I/O가 많은 수집 작업에서 더 빠름).
+    전역 이벤트 루프 정책은 변경하지 않으며, 미설치/Windows에서는 asyncio.run과 동일하다.
+    """
+    if HAS_UVLOOP and hasattr(asyncio, 'Runner'):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(coro)
+    return asyncio.run(coro)
+
 
 class AsyncRateLimiter:
-    """비동기 Rate Limiter"""
+    """
+    비동기 Rate Limiter
+    
+    다음 호출 가능 시각(_next_slot)을 미리 예약하는 방식으로 동작한다.
+    asyncio는 단일 스레드이므로 예약 갱신은 await 없이 원자적으로 이뤄져 락이 필요 없고,
+    동시에 호출한 코루틴들은 각자 다른 시각까지 대기한다. 시각은 loop.time() (monotonic) 기준.
+    """
     
     def __init__(self, calls_per_second: float = 5):
         self.calls_per_second = calls_per_second
         self.min_interval = 1.0 / calls_per_second
-        self.last_call = 0
-        self._lock = asyncio.Lock()
+        self._next_slot = 0.0
     
     async def acquire(self):
-        async with self._lock:
-            now = time.time()
-            elapsed = now - self.last_call
-            if elapsed < self.min_interval:
-                await asyncio.sleep(self.min_interval - elapsed)
-            self.last_call = time.time()
+        now = asyncio.get_running_loop().time()
+        slot = max(self._next_slot, now)
+        self._next_slot = slot + self.min_interval
+        
+        if slot > now:
+            await asyncio.sleep(slot - now)
 
 
 class AsyncBaseCollector(ABC):
     """비동기 수집기 베이스 클래스"""
     
+    MAX_PRESSURE = 60.0              # 서버 요청 대기 시간 상한 (초)
+    
     def __init__(
         self,
         name: str,
         rate_limit: float = 10,      # 초당 호출 수
         max_retries: int = 3,
         timeout: int = 30,
-        max_concurrent: int = 20     # 최대 동시 요청
+        max_concurrent: int = 20,    # 최대 동시 요청 (진행 중인 태스크 수)
+        max_per_host: int = 64       # 호스트별 최대 동시 요청
     ):
         self.name = name
         self.rate_limiter = AsyncRateLimiter(rate_limit)
         self.max_retries = max_retries
         self.timeout = timeout
         self.max_concurrent = max_concurrent
-        self.semaphore = asyncio.Semaphore(max_concurrent)
+        self.max_per_host = max_per_host
+        self._host_sems: Dict[str, asyncio.Semaphore] = {}
+        self._pressure = 0.0         # 서버가 요청한 대기 시간 (초)
         self.logger = logging.getLogger(f"kr_stock_collector.{name}")
         
         # 통계
@@ -59,9 +115,35 @@ class AsyncBaseCollector(ABC):
             'success': 0,
             'failed': 0,
             'start_time': None,
-            'end_time': None
+            'end_time': None,
+            'elapsed': None
         }
     
+    def _note_pressure(self, response: aiohttp.ClientResponse):
+        """
+        응답 헤더에서 서버 부하 신호를 읽어 다음 배치 전 대기 시간을 갱신
+        
+        - Retry-After: 초 단위 대기 요청 (HTTP 날짜 형식은 무시)
+        - X-RateLimit-Remaining이 0이면 X-RateLimit-Reset만큼 대기 (초 또는 epoch 시각, 없으면 1초)
+        - 잘못된 값은 무시하고, 대기 시간은 MAX_PRESSURE로 제한
+        """
+        headers = response.headers
+        wait = _header_seconds(headers.get('Retry-After')) or 0.0
+        
+        remaining = headers.get('X-RateLimit-Remaining')
+        if remaining is not None:
+            try:
+                exhausted = int(remaining) <= 0
+            except ValueError:
+                exhausted = False
+            if exhausted:
+                reset = _header_seconds(headers.get('X-RateLimit-Reset'))
+                wait = max(wait, 1.0 if reset is None else reset)
+        
+        wait = min(wait, self.MAX_PRESSURE)
+        if wait > self._pressure:
+            self._pressure = wait
+    
     async def _request(
         self,
         session: aiohttp.ClientSession,
@@ -72,14 +154,20 @@ class AsyncBaseCollector(ABC):
         """HTTP 요청 (재시도 포함)"""
         await self.rate_limiter.acquire()
         
+        host = urlsplit(url).hostname or ''
+        host_sem = self._host_sems.get(host)
+        if host_sem is None:
+            host_sem = self._host_sems[host] = asyncio.Semaphore(self.max_per_host)
+        
         for attempt in range(self.max_retries):
             try:
-                async with self.semaphore:
+                async with host_sem:
                     async with session.request(
                         method, url, timeout=self.timeout, **kwargs
                     ) as response:
+                        self._note_pressure(response)
                         if response.status == 200:
-                            return await response.json()
+                            return await response.json(loads=json_loads)
                         else:
                             self.logger.warning(
                                 f"HTTP {response.status}: {url[:50]}..."
@@ -114,30 +202,49 @@ class AsyncBaseCollector(ABC):
         items: List[Any],
         progress_callback=None
     ) -> List[Dict]:
-        """배치 수집"""
-        results = []
-        tasks = []
+        """
+        배치 수집
         
-        for item in items:
-            task = asyncio.create_task(self.fetch_single(session, item))
-            tasks.append((item, task))
+        동시 실행 태스크를 max_concurrent개로 제한하고 완료된 순서대로 결과를 처리한다.
+        느린 요청 하나가 통계/진행률 갱신을 막지 않으며, 대기 중인 코루틴이
+        배치 크기만큼 한꺼번에 메모리에 쌓이지 않는다.
+        """
+        results = []
+        pending = set()
+        completed = 0
         
-        for i, (item, task) in enumerate(tasks):
+        async def run_one(item):
             try:
-                result = await task
+                return await self.fetch_single(session, item)
+            except Exception as e:
+                self.logger.error(f"Task failed for {item}: {e}")
+                return None
+        
+        def consume(done):
+            nonlocal completed
+            for task in done:
+                result = task.result()
                 if result:
                     results.append(result)
                     self.stats['success'] += 1
                 else:
                     self.stats['failed'] += 1
-            except Exception as e:
-                self.logger.error(f"Task failed for {item}: {e}")
-                self.stats['failed'] += 1
-            
-            self.stats['total'] += 1
-            
-            if progress_callback and (i + 1) % 50 == 0:
-                progress_callback(i + 1, len(items))
+                
+                self.stats['total'] += 1
+                completed += 1
+                
+                if progress_callback and completed % 50 == 0:
+                    progress_callback(completed, len(items))
+        
+        for item in items:
+            if len(pending) >= self.max_concurrent:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                consume(done)
+            pending.add(asyncio.create_task(run_one(item)))
+        
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            consume(done)
         
         return results
     
@@ -149,6 +256,7 @@ class AsyncBaseCollector(ABC):
     ) -> List[Dict]:
         """전체 수집 (배치 처리)"""
         self.stats['start_time'] = datetime.now()
+        start_ns = time.perf_counter_ns()
         all_results = []
         
         connector = aiohttp.TCPConnector(limit=self.max_concurrent)
@@ -169,12 +277,15 @@ class AsyncBaseCollector(ABC):
                 results = await self.fetch_batch(session, batch, progress_callback)
                 all_results.extend(results)
                 
-                # 배치 간 짧은 휴식
-                if i + batch_size < len(items):
-                    await asyncio.sleep(0.5)
+                # 서버가 부하 신호(Retry-After 등)를 보낸 경우에만 배치 간 대기
+                if self._pressure and i + batch_size < len(items):
+                    self.logger.info(f"서버 요청에 따라 {self._pressure:.1f}초 대기")
+                    await asyncio.sleep(self._pressure)
+                self._pressure = 0.0
         
+        # 소요 시간은 monotonic 카운터 기준 (datetime은 기록용)
         self.stats['end_time'] = datetime.now()
-        elapsed = (self.stats['end_time'] - self.stats['start_time']).total_seconds()
+        self.stats['elapsed'] = elapsed = (time.perf_counter_ns() - start_ns) / 1e9
         
         self.logger.info(
             f"수집 완료: {self.stats['success']}/{self.stats['total']} "
@@ -185,4 +296,4 @@ class AsyncBaseCollector(ABC):
     
     def run(self, items: List[Any], batch_size: int = 100) -> List[Dict]:
         """동기 실행 래퍼"""
-        return asyncio.run(self.collect_all(items, batch_size))
+        return run_async(self.collect_all(items, batch_size))
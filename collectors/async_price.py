@@ -4,17 +4,29 @@
 - 증분 업데이트 지원
 """
 
-import asyncio
+import re
 import aiohttp
 from typing import List, Dict, Optional, Any
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 import logging
 
-from .async_base import AsyncBaseCollector
+from .async_base import AsyncBaseCollector, run_async
+from utils.json_codec import json_loads
+
+try:
+    import pyarrow as pa
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
 
 logger = logging.getLogger("kr_stock_collector.async_price")
 
+# siseJson 행: ["20240102", 78200, 79800, 78200, 79600, 17142847, 53.6]
+_ROW_RE = re.compile(rb'\[\s*"?(\d{8})"?\s*,\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)')
+OHLCV_COLUMNS = ['date', 'open', 'high', 'low', 'close', 'volume']
+
 
 class AsyncPriceCollector(AsyncBaseCollector):
     """비동기 주가 수집기"""
@@ -57,20 +69,22 @@ class AsyncPriceCollector(AsyncBaseCollector):
                 params=params,
                 headers={'User-Agent': 'Mozilla/5.0'}
             ) as response:
+                self._note_pressure(response)
                 if response.status != 200:
                     return None
                 
-                text = await response.text()
-                
-                # 간단한 파싱 (실제로는 더 정교하게)
-                if not text or 'error' in text.lower():
-                    return None
-                
-                return {
-                    'code': code,
-                    'data': text,
-                    'collected_at': datetime.now().isoformat()
-                }
+                raw = await response.read()
+            
+            # 응답 본문을 바로 (날짜, 시가, 고가, 저가, 종가, 거래량) int64 배열로 변환
+            rows = _ROW_RE.findall(raw)
+            if not rows:
+                return None
+            
+            return {
+                'code': code,
+                'ohlcv': np.array(rows, dtype=bytes).astype(np.int64),
+                'collected_at': datetime.now().isoformat()
+            }
                 
         except Exception as e:
             self.logger.debug(f"[{code}] 수집 실패: {e}")
@@ -78,7 +92,12 @@ class AsyncPriceCollector(AsyncBaseCollector):
 
 
 class AsyncMarketCapCollector(AsyncBaseCollector):
-    """비동기 시가총액 수집기 (KRX)"""
+    """
+    비동기 시가총액 수집기 (KRX)
+    
+    KRX API는 한 번의 POST로 전 종목을 반환하므로 종목별 수집(collect_all/fetch_single)
+    대신 collect()로 일괄 수집만 지원한다.
+    """
     
     KRX_API = "http://data.krx.co.kr/comm/bldAttendant/getJsonData.cmd"
     
@@ -121,20 +140,42 @@ class AsyncMarketCapCollector(AsyncBaseCollector):
                 headers=headers
             ) as response:
                 if response.status == 200:
-                    result = await response.json()
+                    result = await response.json(loads=json_loads)
                     return result.get('OutBlock_1', [])
         except Exception as e:
             self.logger.error(f"KRX API 오류: {e}")
         
         return []
     
+    async def collect(
+        self,
+        session: Optional[aiohttp.ClientSession] = None,
+        market: str = 'ALL'
+    ) -> List[Dict]:
+        """전 종목 시가총액 일괄 수집 (요청 1회, 세션 미지정 시 생성)"""
+        if session is not None:
+            return await self.fetch_all_marketcap(session, market)
+        
+        connector = aiohttp.TCPConnector(limit=self.max_concurrent)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        
+        async with aiohttp.ClientSession(
+            connector=connector,
+            timeout=timeout
+        ) as session:
+            return await self.fetch_all_marketcap(session, market)
+    
     async def fetch_single(
         self,
         session: aiohttp.ClientSession,
         item: Any
     ) -> Optional[Dict]:
-        """단일 수집 (사용 안함)"""
-        pass
+        """종목별 수집은 지원하지 않음 (collect() 사용)"""
+        raise NotImplementedError("KRX 시가총액은 collect()로 일괄 수집하세요")
+    
+    async def collect_all(self, *args, **kwargs) -> List[Dict]:
+        """종목별 배치 수집은 지원하지 않음 (collect() 사용)"""
+        raise NotImplementedError("KRX 시가총액은 collect()로 일괄 수집하세요")
 
 
 async def collect_all_prices(
@@ -142,7 +183,12 @@ async def collect_all_prices(
     start_date: str = None,
     progress_callback=None
 ) -> pd.DataFrame:
-    """전 종목 주가 수집 (메인 함수)"""
+    """
+    전 종목 주가 수집 (메인 함수)
+    
+    Returns:
+        종목별 일봉 DataFrame (code, date, open, high, low, close, volume)
+    """
     
     if start_date is None:
         start_date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
@@ -152,25 +198,86 @@ async def collect_all_prices(
     collector = AsyncPriceCollector()
     results = await collector.collect_all(items, batch_size=100, progress_callback=progress_callback)
     
-    if results:
-        return pd.DataFrame(results)
+    if not results:
+        return pd.DataFrame()
     
-    return pd.DataFrame()
+    # 종목별 배열을 한 번에 이어 붙여 DataFrame 생성 (종목코드, 날짜, OHLCV)
+    ohlcv = np.concatenate([r['ohlcv'] for r in results])
+    df = pd.DataFrame(ohlcv, columns=OHLCV_COLUMNS)
+    df.insert(0, 'code', np.repeat(
+        [r['code'] for r in results],
+        [len(r['ohlcv']) for r in results]
+    ))
+    df['date'] = pd.to_datetime(df['date'].astype(str), format='%Y%m%d')
+    
+    return df
+
+
+def _yyyymmdd_to_date(values: np.ndarray) -> np.ndarray:
+    """YYYYMMDD 정수 배열 → datetime64[D] 배열 (문자열 변환 없이 산술로 계산)"""
+    years = (values // 10000 - 1970).astype('datetime64[Y]')
+    months = years + (values // 100 % 100 - 1).astype('timedelta64[M]')
+    return months + (values % 100 - 1).astype('timedelta64[D]')
+
+
+def ohlcv_record_batch(results: List[Dict]) -> 'pa.RecordBatch':
+    """
+    fetch_single 결과 목록 → Arrow RecordBatch (code, date, open, high, low, close, volume)
+    
+    OHLCV는 int64 배열을 그대로 Arrow 버퍼로 넘기고, 종목코드는 종목별 반복 대신
+    사전(dictionary) 인코딩으로 저장한다. Polars/DuckDB/Parquet 등에서 복사 없이 사용 가능.
+    """
+    ohlcv = np.concatenate([r['ohlcv'] for r in results])
+    indices = np.repeat(
+        np.arange(len(results), dtype=np.int32),
+        [len(r['ohlcv']) for r in results]
+    )
+    
+    arrays = [
+        pa.DictionaryArray.from_arrays(
+            pa.array(indices),
+            pa.array([r['code'] for r in results], type=pa.string())
+        ),
+        pa.array(_yyyymmdd_to_date(ohlcv[:, 0]))
+    ]
+    arrays.extend(pa.array(np.ascontiguousarray(ohlcv[:, i])) for i in range(1, len(OHLCV_COLUMNS)))
+    
+    return pa.RecordBatch.from_arrays(arrays, names=['code'] + OHLCV_COLUMNS)
+
+
+async def collect_all_prices_arrow(
+    stock_codes: List[str],
+    start_date: str = None,
+    progress_callback=None
+) -> Optional['pa.RecordBatch']:
+    """
+    전 종목 주가 수집 (Arrow 반환, pyarrow 필요)
+    
+    Returns:
+        RecordBatch (code, date, open, high, low, close, volume), 수집 결과가 없으면 None
+    """
+    if not HAS_PYARROW:
+        raise ImportError("pyarrow가 설치되어 있지 않습니다 (pip install pyarrow)")
+    
+    if start_date is None:
+        start_date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
+    
+    items = [{'code': code, 'start_date': start_date} for code in stock_codes]
+    
+    collector = AsyncPriceCollector()
+    results = await collector.collect_all(items, batch_size=100, progress_callback=progress_callback)
+    
+    if not results:
+        return None
+    
+    return ohlcv_record_batch(results)
 
 
 async def collect_all_marketcap() -> pd.DataFrame:
     """전 종목 시가총액 수집"""
     
     collector = AsyncMarketCapCollector()
-    
-    connector = aiohttp.TCPConnector(limit=5)
-    timeout = aiohttp.ClientTimeout(total=30)
-    
-    async with aiohttp.ClientSession(
-        connector=connector,
-        timeout=timeout
-    ) as session:
-        results = await collector.fetch_all_marketcap(session)
+    results = await collector.collect()
     
     if results:
         df = pd.DataFrame(results)
@@ -200,4 +307,4 @@ if __name__ == '__main__':
         if not df.empty:
             print(df.head())
     
-    asyncio.run(test())
+    run_async(test())
@@ -2,56 +2,91 @@
 공통 수집기 베이스 클래스
 - 에러 핸들링
 - 재시도 로직
-- 캐싱 지원
+- 캐싱 지원 (수집기별 SQLite 파일)
 """
 
+import io
 import os
-import json
-import hashlib
+import random
+import sqlite3
+import threading
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
+import pandas as pd
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
-from datetime import datetime, timedelta
+from typing import Optional, Dict, Any, Tuple, Type
 from functools import wraps
 
 from utils.rate_limiter import RateLimiter
+from utils.json_codec import json_dumps, json_loads
+
+try:
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
+try:
+    import pyarrow  # noqa: F401  (DataFrame 캐시 Parquet 직렬화)
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+try:
+    import h2  # noqa: F401  (httpx HTTP/2 지원)
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
 
 logger = logging.getLogger("kr_stock_collector.base")
 
 
-def retry(max_attempts: int = 3, delay: float = 1.0, backoff: float = 2.0):
+def retry(
+    max_attempts: int = 3,
+    delay: float = 1.0,
+    backoff: float = 2.0,
+    max_delay: float = 8.0,
+    jitter: float = 0.5,
+    exceptions: Tuple[Type[BaseException], ...] = (Exception,)
+):
     """
-    재시도 데코레이터
+    재시도 데코레이터 (Exponential Backoff + Jitter)
     
     Args:
         max_attempts: 최대 시도 횟수
         delay: 초기 대기 시간 (초)
         backoff: 대기 시간 증가 배수
+        max_delay: 최대 대기 시간 (초)
+        jitter: 대기 시간 무작위 편차 비율 (0.5면 ±50%) - 여러 요청이 동시에 재시도하는 것을 방지
+        exceptions: 재시도 대상 예외 타입
     """
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            attempts = 0
-            current_delay = delay
+            # 성공 경로: 재시도 상태 없이 바로 호출
+            try:
+                return func(*args, **kwargs)
+            except exceptions as e:
+                last_error = e
             
-            while attempts < max_attempts:
+            current_delay = delay
+            for attempt in range(1, max_attempts):
+                logger.warning(
+                    f"{func.__name__} 재시도 {attempt}/{max_attempts}: {last_error}"
+                )
+                time.sleep(current_delay * random.uniform(1 - jitter, 1 + jitter))
+                current_delay = min(current_delay * backoff, max_delay)
+                
                 try:
                     return func(*args, **kwargs)
-                except Exception as e:
-                    attempts += 1
-                    if attempts == max_attempts:
-                        logger.error(f"{func.__name__} 최종 실패: {e}")
-                        raise
-                    
-                    logger.warning(
-                        f"{func.__name__} 재시도 {attempts}/{max_attempts}: {e}"
-                    )
-                    time.sleep(current_delay)
-                    current_delay *= backoff
+                except exceptions as e:
+                    last_error = e
             
-            return None
+            logger.error(f"{func.__name__} 최종 실패: {last_error}")
+            raise last_error
         return wrapper
     return decorator
 
@@ -68,7 +103,8 @@ class BaseCollector(ABC):
         name: str,
         cache_dir: str = "cache",
         cache_expiry_days: int = 7,
-        rate_limit_per_minute: int = 100
+        rate_limit_per_minute: int = 100,
+        rate_limit_burst: Optional[float] = None
     ):
         """
         Args:
@@ -76,45 +112,131 @@ class BaseCollector(ABC):
             cache_dir: 캐시 디렉토리
             cache_expiry_days: 캐시 만료 일수
             rate_limit_per_minute: 분당 API 호출 제한
+            rate_limit_burst: 대기 없이 연속 허용할 호출 수 (None이면 버스트 없이 고정 간격)
         """
         self.name = name
         self.cache_dir = cache_dir
         self.cache_expiry_days = cache_expiry_days
-        self.rate_limiter = RateLimiter(calls_per_minute=rate_limit_per_minute)
+        self.rate_limiter = RateLimiter(calls_per_minute=rate_limit_per_minute, burst=rate_limit_burst)
         
-        self._session = requests.Session()
-        self._session.headers.update({
-            'User-Agent': 'KRStockCollector/1.0'
-        })
+        self._session = self._create_session()
         
         os.makedirs(cache_dir, exist_ok=True)
         
         self.logger = logging.getLogger(f"kr_stock_collector.{name}")
+        
+        self._cache_lock = threading.Lock()
+        self._cache_db = self._open_cache_db()
     
-    def _get_cache_path(self, key: str) -> str:
-        """캐시 파일 경로 생성"""
-        hash_key = hashlib.md5(key.encode()).hexdigest()
-        return os.path.join(self.cache_dir, f"{self.name}_{hash_key}.json")
+    def _create_session(self):
+        """
+        HTTP 세션 생성
+        
+        httpx가 설치되어 있으면 커넥션 풀(+ h2 설치 시 HTTP/2 멀티플렉싱)을 쓰는
+        httpx.Client를, 없으면 requests.Session을 사용한다. 두 세션 모두
+        get/post/headers.update 인터페이스와 응답 객체(json, status_code, content)가 호환된다.
+        
+        연결 실패는 전송 계층에서 재시도하고, requests 경로는 GET의 429/5xx 응답도
+        Retry-After를 따라 재시도한다.
+        """
+        headers = {'User-Agent': 'KRStockCollector/1.0'}
+        
+        if HAS_HTTPX:
+            return httpx.Client(
+                headers=headers,
+                transport=httpx.HTTPTransport(
+                    http2=HAS_HTTP2,
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                    retries=3
+                ),
+                follow_redirects=True
+            )
+        
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset({'GET'}),
+                raise_on_status=False
+            )
+        )
+        
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers.update(headers)
+        return session
     
-    def _get_from_cache(self, key: str) -> Optional[Any]:
-        """캐시에서 데이터 조회"""
-        cache_path = self._get_cache_path(key)
+    def _open_cache_db(self) -> Optional[sqlite3.Connection]:
+        """
+        캐시 DB 연결 ({cache_dir}/{name}.db)
         
-        if not os.path.exists(cache_path):
+        키별 JSON 파일 대신 단일 SQLite(WAL) 테이블에 저장하고,
+        만료된 항목은 연결 시 한 번에 정리한다.
+        """
+        try:
+            conn = sqlite3.connect(
+                os.path.join(self.cache_dir, f"{self.name}.db"),
+                isolation_level=None,
+                check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at INTEGER NOT NULL)"
+            )
+            conn.execute("DELETE FROM cache WHERE expires_at <= ?", (int(time.time()),))
+            return conn
+        except sqlite3.Error as e:
+            self.logger.warning(f"캐시 DB 열기 실패 (캐시 미사용): {e}")
             return None
+    
+    def _read_cache_entry(self, key: str) -> Optional[Tuple[bytes, int]]:
+        """캐시 원본 값과 만료 시각(epoch 초) 조회 (만료된 항목은 조회되지 않음)"""
+        if self._cache_db is None:
+            return None
+        
+        with self._cache_lock:
+            row = self._cache_db.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ? AND expires_at > ?",
+                (key, int(time.time()))
+            ).fetchone()
+        
+        return None if row is None else (row[0], row[1])
+    
+    def _read_cache_blob(self, key: str) -> Optional[bytes]:
+        """캐시 원본 값 조회 (만료된 항목은 조회되지 않음)"""
+        entry = self._read_cache_entry(key)
+        return None if entry is None else entry[0]
+    
+    def _write_cache_blob(self, key: str, value: bytes, expiry_days: Optional[float] = None) -> None:
+        """캐시 원본 값 저장 (expiry_days 미지정 시 수집기 기본 만료 일수, 소수 허용)"""
+        if self._cache_db is None:
+            return
+        
+        if expiry_days is None:
+            expiry_days = self.cache_expiry_days
+        expires_at = int(time.time() + expiry_days * 86400)
         
+        with self._cache_lock:
+            self._cache_db.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, expires_at)
+            )
+    
+    def _get_from_cache(self, key: str) -> Optional[Any]:
+        """캐시에서 데이터 조회 (만료된 항목은 조회되지 않음)"""
         try:
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                cached = json.load(f)
-            
-            # 만료 체크
-            cached_time = datetime.fromisoformat(cached.get('timestamp', ''))
-            if datetime.now() - cached_time > timedelta(days=self.cache_expiry_days):
-                os.remove(cache_path)
+            value = self._read_cache_blob(key)
+            if value is None:
                 return None
             
             self.logger.debug(f"캐시 히트: {key}")
-            return cached.get('data')
+            return json_loads(value)
             
         except Exception as e:
             self.logger.warning(f"캐시 읽기 실패: {e}")
@@ -122,19 +244,52 @@ class BaseCollector(ABC):
     
     def _save_to_cache(self, key: str, data: Any) -> None:
         """캐시에 데이터 저장"""
-        cache_path = self._get_cache_path(key)
+        try:
+            self._write_cache_blob(key, json_dumps(data))
+            self.logger.debug(f"캐시 저장: {key}")
+        
+        except Exception as e:
+            self.logger.warning(f"캐시 저장 실패: {e}")
+    
+    def _get_frame_from_cache(self, key: str) -> Optional[pd.DataFrame]:
+        """
+        캐시에서 DataFrame 조회 (Parquet 형식, pyarrow 필요)
+        
+        dtype/인덱스가 그대로 복원되므로 날짜 재파싱 등 후처리가 필요 없다.
+        """
+        if not HAS_PYARROW:
+            return None
         
         try:
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'timestamp': datetime.now().isoformat(),
-                    'data': data
-                }, f, ensure_ascii=False, indent=2)
+            value = self._read_cache_blob(f"{key}.parquet")
+            if value is None:
+                return None
             
+            self.logger.debug(f"캐시 히트: {key}")
+            return pd.read_parquet(io.BytesIO(value))
+            
+        except Exception as e:
+            self.logger.warning(f"캐시 읽기 실패: {e}")
+            return None
+    
+    def _save_frame_to_cache(self, key: str, df: pd.DataFrame) -> bool:
+        """
+        DataFrame을 Parquet(zstd)으로 캐시에 저장
+        
+        Returns:
+            저장 여부 (pyarrow 미설치/실패 시 False - 호출자가 JSON 캐시로 대체)
+        """
+        if not HAS_PYARROW:
+            return False
+        
+        try:
+            self._write_cache_blob(f"{key}.parquet", df.to_parquet(compression='zstd'))
             self.logger.debug(f"캐시 저장: {key}")
+            return True
             
         except Exception as e:
             self.logger.warning(f"캐시 저장 실패: {e}")
+            return False
     
     def _make_request(
         self,
@@ -153,24 +308,21 @@ class BaseCollector(ABC):
             url: 요청 URL
             params: 쿼리 파라미터
             data: POST 데이터
-            headers: 추가 헤더
+            headers: 이 요청에만 추가할 헤더 (세션 기본 헤더는 변경하지 않음)
             timeout: 타임아웃 (초)
         
         Returns:
-            Response 객체
+            Response 객체 (requests 또는 httpx)
         """
         # Rate limit 대기
         if not self.rate_limiter.wait():
             raise Exception("일일 API 호출 한도 초과")
         
-        if headers:
-            self._session.headers.update(headers)
-        
         if method.upper() == 'GET':
-            response = self._session.get(url, params=params, timeout=timeout)
+            response = self._session.get(url, params=params, headers=headers, timeout=timeout)
         elif method.upper() == 'POST':
             response = self._session.post(
-                url, params=params, json=data, timeout=timeout
+                url, params=params, json=data, headers=headers, timeout=timeout
             )
         else:
             raise ValueError(f"지원하지 않는 HTTP 메서드: {method}")
@@ -183,5 +335,10 @@ class BaseCollector(ABC):
         pass
     
     def close(self) -> None:
-        """세션 종료"""
+        """세션 및 캐시 DB 종료"""
         self._session.close()
+        
+        if self._cache_db is not None:
+            with self._cache_lock:
+                self._cache_db.close()
+                self._cache_db = None
@@ -2,60 +2,142 @@
 한국은행 ECOS API 수집기 (v4 - 수정된 항목코드)
 - 정확한 ECOS API 항목코드 적용
 - 부분 실패 허용
+- 지표 동시 조회 (aiohttp)
 """
 
+import asyncio
+import calendar
 import requests
+import numpy as np
 import pandas as pd
-from typing import Optional, Dict, List
-from datetime import datetime
+from typing import Optional, Dict, List, Literal, Tuple
+from dataclasses import dataclass
+from datetime import date
+from functools import lru_cache
 import logging
+import time
 
 from .base_collector import BaseCollector, retry
+from utils.json_codec import json_loads
+
+try:
+    import aiohttp
+    from .async_base import AsyncRateLimiter, run_async
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
 
 logger = logging.getLogger("kr_stock_collector.bok")
 
 
+def _months_before(day: date, months: int) -> date:
+    """n개월 전 같은 날 (말일 초과 시 해당 월 말일, pd.DateOffset과 동일)"""
+    year, month = divmod(day.year * 12 + day.month - 1 - months, 12)
+    month += 1
+    return date(year, month, min(day.day, calendar.monthrange(year, month)[1]))
+
+
+@lru_cache(maxsize=16)
+def _date_range(freq: str, today: date) -> tuple:
+    """주기에 따른 조회 날짜 범위 (같은 날짜/주기는 한 번만 계산)"""
+    if freq == 'D':
+        # 최근 1개월
+        end = today.strftime('%Y%m%d')
+        start = _months_before(today, 1).strftime('%Y%m%d')
+    elif freq == 'M':
+        # 최근 6개월
+        end = today.strftime('%Y%m')
+        start = _months_before(today, 6).strftime('%Y%m')
+    elif freq == 'Q':
+        # 최근 4분기
+        q = (today.month - 1) // 3 + 1
+        end = f"{today.year}Q{q}"
+        start = f"{today.year - 1}Q{q}"
+    else:
+        end = today.strftime('%Y')
+        start = str(today.year - 1)
+    
+    return start, end
+
+
+@dataclass(frozen=True)
+class IndicatorSpec:
+    """ECOS 지표 조회 정보"""
+    __slots__ = ('stat_code', 'item1', 'item2', 'freq')
+    
+    stat_code: str                      # 통계표코드
+    item1: str                          # 항목코드1
+    item2: str                          # 항목코드2 (없으면 빈 문자열)
+    freq: Literal['D', 'M', 'Q', 'A']   # 주기
+
+
+def _flatten_jobs(categories: Dict[str, List[str]], indicators: Dict[str, IndicatorSpec]) -> tuple:
+    """
+    (카테고리, 지표명, IndicatorSpec) 수집 일정
+    
+    CATEGORIES에 있지만 INDICATORS에 없는 지표는 import 시점에 KeyError로 드러난다.
+    """
+    return tuple(
+        (cat, name, indicators[name])
+        for cat, names in categories.items()
+        for name in names
+    )
+
+
+def _shared_tables(indicators: Dict[str, IndicatorSpec]) -> Dict[tuple, tuple]:
+    """
+    같은 (통계표코드, 주기)를 쓰는 지표 묶음 (2개 이상, 항목코드2 없는 지표만)
+    
+    묶음은 항목코드 없이 한 번에 조회한 뒤 ITEM_CODE1으로 나눈다.
+    """
+    groups: Dict[tuple, list] = {}
+    for name, spec in indicators.items():
+        if not spec.item2:
+            groups.setdefault((spec.stat_code, spec.freq), []).append(name)
+    return {key: tuple(names) for key, names in groups.items() if len(names) > 1}
+
+
 class BOKCollector(BaseCollector):
     """한국은행 ECOS API 수집기 (수정된 항목코드)"""
     
     BASE_URL = "https://ecos.bok.or.kr/api/StatisticSearch"
     
     # ===== 수정된 한국 경제지표 (올바른 ECOS 코드) =====
-    # 형식: (통계표코드, 항목코드1, 항목코드2, 주기)
+    # 형식: IndicatorSpec(통계표코드, 항목코드1, 항목코드2, 주기)
     # 항목코드2가 필요없으면 빈 문자열
     INDICATORS = {
         # 금리 (6개)
-        '기준금리': ('722Y001', '0101000', '', 'M'),
-        'CD금리(91일)': ('817Y002', '010502000', '', 'D'),
-        '국고채3년': ('817Y002', '010200000', '', 'D'),
-        '국고채5년': ('817Y002', '010200001', '', 'D'),
-        '국고채10년': ('817Y002', '010210000', '', 'D'),
-        '회사채AA-': ('817Y002', '010300000', '', 'D'),
+        '기준금리': IndicatorSpec('722Y001', '0101000', '', 'M'),
+        'CD금리(91일)': IndicatorSpec('817Y002', '010502000', '', 'D'),
+        '국고채3년': IndicatorSpec('817Y002', '010200000', '', 'D'),
+        '국고채5년': IndicatorSpec('817Y002', '010200001', '', 'D'),
+        '국고채10년': IndicatorSpec('817Y002', '010210000', '', 'D'),
+        '회사채AA-': IndicatorSpec('817Y002', '010300000', '', 'D'),
         
         # 물가 (3개)
-        '소비자물가지수': ('901Y009', '0', '', 'M'),
-        '근원물가지수': ('901Y009', 'CB', '', 'M'),
-        '생산자물가지수': ('901Y010', 'AA', '', 'M'),
+        '소비자물가지수': IndicatorSpec('901Y009', '0', '', 'M'),
+        '근원물가지수': IndicatorSpec('901Y009', 'CB', '', 'M'),
+        '생산자물가지수': IndicatorSpec('901Y010', 'AA', '', 'M'),
         
         # 통화 (3개)
-        'M2(광의통화)': ('101Y003', 'BBGA00', '', 'M'),
-        '본원통화': ('101Y001', 'BBGA00', '', 'M'),
-        '가계신용': ('151Y002', 'BLCA', '', 'Q'),
+        'M2(광의통화)': IndicatorSpec('101Y003', 'BBGA00', '', 'M'),
+        '본원통화': IndicatorSpec('101Y001', 'BBGA00', '', 'M'),
+        '가계신용': IndicatorSpec('151Y002', 'BLCA', '', 'Q'),
         
         # 경기 (4개)
-        '경기선행지수': ('901Y067', 'I16B', '', 'M'),
-        '경기동행지수': ('901Y067', 'I16C', '', 'M'),
-        '소비자심리지수': ('511Y002', 'FME', '', 'M'),
-        'BSI(제조업)': ('512Y014', 'A001', '', 'M'),
+        '경기선행지수': IndicatorSpec('901Y067', 'I16B', '', 'M'),
+        '경기동행지수': IndicatorSpec('901Y067', 'I16C', '', 'M'),
+        '소비자심리지수': IndicatorSpec('511Y002', 'FME', '', 'M'),
+        'BSI(제조업)': IndicatorSpec('512Y014', 'A001', '', 'M'),
         
         # 무역 (3개)
-        '수출금액': ('403Y001', 'A', '', 'M'),
-        '수입금액': ('403Y001', 'B', '', 'M'),
-        '경상수지': ('301Y013', 'CA', '', 'M'),
+        '수출금액': IndicatorSpec('403Y001', 'A', '', 'M'),
+        '수입금액': IndicatorSpec('403Y001', 'B', '', 'M'),
+        '경상수지': IndicatorSpec('301Y013', 'CA', '', 'M'),
         
         # 고용 (2개)
-        '실업률': ('901Y027', '1', '', 'M'),
-        '고용률': ('901Y028', '1', '', 'M'),
+        '실업률': IndicatorSpec('901Y027', '1', '', 'M'),
+        '고용률': IndicatorSpec('901Y028', '1', '', 'M'),
     }
     
     CATEGORIES = {
@@ -67,6 +149,22 @@ class BOKCollector(BaseCollector):
         '고용': ['실업률', '고용률'],
     }
     
+    # 카테고리 순서대로 펼친 수집 일정 (클래스 정의 시 한 번 계산)
+    _JOBS = _flatten_jobs(CATEGORIES, INDICATORS)
+    
+    # 통계표 단위 일괄 조회 묶음: (통계표코드, 주기) → 지표명들, 지표명 → (통계표코드, 주기)
+    SHARED_TABLES = _shared_tables(INDICATORS)
+    _TABLE_OF = {name: key for key, names in SHARED_TABLES.items() for name in names}
+    
+    # 통계표 일괄 조회 시 최대 행 수 (전 항목 × 기간)
+    TABLE_ROW_LIMIT = 10000
+    
+    # 지표별 URL 경로 템플릿 (날짜 범위만 요청 시 채움)
+    URL_TEMPLATES = {
+        name: f"/{spec.stat_code}/{spec.freq}/{{start}}/{{end}}/{spec.item1}" + (f"/{spec.item2}" if spec.item2 else "")
+        for name, spec in INDICATORS.items()
+    }
+    
     def __init__(self, api_key: str, cache_dir: str = "cache"):
         super().__init__(
             name="bok",
@@ -75,102 +173,373 @@ class BOKCollector(BaseCollector):
             rate_limit_per_minute=50
         )
         self.api_key = api_key
+        self._url_prefix = f"{self.BASE_URL}/{api_key}/json/kr/1/100"
+        self._table_prefix = f"{self.BASE_URL}/{api_key}/json/kr/1/{self.TABLE_ROW_LIMIT}"
+        # API 키까지 결합한 전체 URL 템플릿 (요청 시 format 한 번으로 완성)
+        self._url_templates = {
+            name: self._url_prefix + template for name, template in self.URL_TEMPLATES.items()
+        }
+        self._table_url_templates = {
+            key: f"{self._table_prefix}/{key[0]}/{key[1]}/{{start}}/{{end}}" for key in self.SHARED_TABLES
+        }
+        self._memo: Dict[str, Tuple[float, Dict]] = {}   # 프로세스 내 캐시 (디스크 캐시 앞단): 키 → (만료 시각, 결과)
     
     def _get_date_range(self, freq: str) -> tuple:
-        """주기에 따른 날짜 범위"""
-        now = datetime.now()
-        
-        if freq == 'D':
-            # 최근 1개월
-            end = now.strftime('%Y%m%d')
-            start = (now - pd.DateOffset(months=1)).strftime('%Y%m%d')
-        elif freq == 'M':
-            # 최근 6개월
-            end = now.strftime('%Y%m')
-            start = (now - pd.DateOffset(months=6)).strftime('%Y%m')
-        elif freq == 'Q':
-            # 최근 4분기
-            q = (now.month - 1) // 3 + 1
-            end = f"{now.year}Q{q}"
-            start = f"{now.year - 1}Q{q}"
-        else:
-            end = now.strftime('%Y')
-            start = str(now.year - 1)
-        
-        return start, end
+        """주기에 따른 날짜 범위 (하루 단위로 캐시)"""
+        return _date_range(freq, date.today())
+    
+    def _build_url(self, name: str) -> str:
+        """지표 조회 URL 구성 (항목코드2가 없으면 생략된 템플릿 사용)"""
+        start, end = self._get_date_range(self.INDICATORS[name].freq)
+        return self._url_templates[name].format(start=start, end=end)
+    
+    def _build_table_url(self, stat_code: str, freq: str) -> str:
+        """통계표 전 항목 조회 URL (항목코드 생략)"""
+        start, end = self._get_date_range(freq)
+        return self._table_url_templates[(stat_code, freq)].format(start=start, end=end)
+    
+    def _cache_key(self, name: str) -> str:
+        """지표 캐시 키 (조회 날짜 범위 포함 - 범위가 바뀌면 자동으로 새로 조회)"""
+        start, end = self._get_date_range(self.INDICATORS[name].freq)
+        return f"indicator_{name}_{start}_{end}"
+    
+    def _get_cached_indicator(self, key: str) -> Optional[Dict]:
+        """
+        메모리 → 디스크 순으로 캐시 조회
+        
+        메모리 항목도 디스크 캐시와 같은 만료 시각을 따르므로, 월/분기 지표처럼 조회 범위(키)가
+        오래 유지되어도 만료 후에는 다시 조회해 ECOS 수정치를 반영한다.
+        """
+        memo = self._memo.get(key)
+        if memo is not None:
+            if memo[0] > time.time():
+                return memo[1]
+            self._memo.pop(key, None)
+        
+        try:
+            entry = self._read_cache_entry(key)
+            if entry is None:
+                return None
+            blob, expires_at = entry
+            data = json_loads(blob)
+        except Exception as e:
+            self.logger.warning(f"캐시 읽기 실패: {e}")
+            return None
+        
+        self._memo[key] = (expires_at, data)
+        return data
+    
+    def _save_indicator(self, key: str, data: Optional[Dict]) -> Optional[Dict]:
+        """조회 성공 결과만 메모리/디스크 캐시에 저장"""
+        if data:
+            self._memo[key] = (time.time() + self.cache_expiry_days * 86400, data)
+            self._save_to_cache(key, data)
+        return data
+    
+    def _response_rows(self, label: str, data: Dict) -> Optional[List[Dict]]:
+        """ECOS 응답 행 목록 (오류 응답이면 None)"""
+        # 응답 확인
+        if 'StatisticSearch' not in data:
+            error_msg = data.get('RESULT', {}).get('MESSAGE', 'Unknown')
+            self.logger.debug(f"BOK [{label}]: {error_msg}")
+            return None
+        
+        return data['StatisticSearch'].get('row', [])
+    
+    @staticmethod
+    def _row_result(name: str, row: Dict) -> Dict:
+        """응답 행 → 지표 결과"""
+        try:
+            value = float(row.get('DATA_VALUE', 0))
+        except:
+            value = 0
+        
+        return {
+            'indicator': name,
+            'date': row.get('TIME', ''),
+            'value': value,
+        }
+    
+    def _parse_response(self, name: str, data: Dict) -> Optional[Dict]:
+        """ECOS 응답에서 최신값 추출"""
+        rows = self._response_rows(name, data)
+        if not rows:
+            return None
+        
+        # 가장 최신 데이터
+        return self._row_result(name, rows[-1])
+    
+    def _parse_table_response(self, names: tuple, data: Dict) -> Optional[Dict[str, Dict]]:
+        """
+        통계표 전 항목 응답을 지표별 최신값으로 분리
+        
+        Returns:
+            {지표명: 결과} (응답에 없는 항목은 제외), 오류 응답이면 None
+        """
+        rows = self._response_rows(self.INDICATORS[names[0]].stat_code, data)
+        if rows is None:
+            return None
+        
+        by_item = {self.INDICATORS[name].item1: name for name in names}
+        latest: Dict[str, Dict] = {}
+        
+        for row in rows:
+            name = by_item.get(row.get('ITEM_CODE1'))
+            # 같은 시점이면 뒤 행 우선 (단일 조회의 rows[-1]과 동일)
+            if name is not None and (name not in latest or row.get('TIME', '') >= latest[name].get('TIME', '')):
+                latest[name] = row
+        
+        return {name: self._row_result(name, row) for name, row in latest.items()}
     
-    @retry(max_attempts=3, delay=1.0)
     def _fetch_indicator(self, name: str) -> Optional[Dict]:
-        """단일 지표 최신값 조회"""
+        """단일 지표 최신값 조회 (캐시 우선)"""
         if name not in self.INDICATORS:
             return None
         
-        stat_code, item1, item2, freq = self.INDICATORS[name]
-        start, end = self._get_date_range(freq)
+        key = self._cache_key(name)
+        cached = self._get_cached_indicator(key)
+        if cached is not None:
+            return cached
         
-        # URL 구성 - item2가 빈 문자열이면 생략
-        if item2:
-            url = f"{self.BASE_URL}/{self.api_key}/json/kr/1/100/{stat_code}/{freq}/{start}/{end}/{item1}/{item2}"
-        else:
-            url = f"{self.BASE_URL}/{self.api_key}/json/kr/1/100/{stat_code}/{freq}/{start}/{end}/{item1}"
+        return self._save_indicator(key, self._request_indicator(name))
+    
+    @retry(max_attempts=3, delay=1.0)
+    def _request_indicator(self, name: str) -> Optional[Dict]:
+        """단일 지표 최신값 API 조회"""
+        url = self._build_url(name)
         
         try:
             response = self._make_request('GET', url, timeout=15)
-            data = response.json()
-            
-            # 응답 확인
-            if 'StatisticSearch' not in data:
-                error_msg = data.get('RESULT', {}).get('MESSAGE', 'Unknown')
-                self.logger.debug(f"BOK [{name}]: {error_msg}")
-                return None
-            
-            rows = data['StatisticSearch'].get('row', [])
-            if not rows:
-                return None
-            
-            # 가장 최신 데이터
-            latest = rows[-1]
-            
-            try:
-                value = float(latest.get('DATA_VALUE', 0))
-            except:
-                value = 0
-            
-            return {
-                'indicator': name,
-                'date': latest.get('TIME', ''),
-                'value': value,
-            }
+            return self._parse_response(name, json_loads(response.content))
             
         except Exception as e:
             self.logger.debug(f"BOK [{name}] 오류: {e}")
             return None
     
+    def _fetch_table(self, stat_code: str, freq: str) -> Dict[str, Optional[Dict]]:
+        """
+        통계표 묶음 지표 최신값 조회 (캐시 우선, 요청 1회)
+        
+        응답에 빠진 항목이나, 재시도 후에도 통계표 요청이 실패한 경우는 지표별 조회로 보완한다.
+        """
+        names = self.SHARED_TABLES[(stat_code, freq)]
+        results = {name: self._get_cached_indicator(self._cache_key(name)) for name in names}
+        missing = tuple(name for name in names if results[name] is None)
+        if not missing:
+            return results
+        
+        try:
+            fetched = self._request_table(stat_code, freq, missing)
+        except Exception as e:
+            self.logger.warning(f"BOK [{stat_code}] 통계표 조회 실패, 지표별 조회로 대체: {e}")
+            fetched = {}
+        
+        for name in missing:
+            if name in fetched:
+                results[name] = self._save_indicator(self._cache_key(name), fetched[name])
+            else:
+                results[name] = self._fetch_indicator(name)
+        
+        return results
+    
+    @retry(max_attempts=3, delay=1.0)
+    def _request_table(self, stat_code: str, freq: str, names: tuple) -> Dict[str, Dict]:
+        """
+        통계표 전 항목 API 조회
+        
+        요청/HTTP 오류는 그대로 전파해 재시도한다 (429/5xx 포함).
+        
+        Returns:
+            {지표명: 결과} (오류 응답이나 JSON 파싱 실패면 빈 dict - 지표별 조회로 보완)
+        """
+        url = self._build_table_url(stat_code, freq)
+        response = self._make_request('GET', url, timeout=15)
+        response.raise_for_status()
+        
+        try:
+            return self._parse_table_response(names, json_loads(response.content)) or {}
+        except ValueError as e:
+            self.logger.debug(f"BOK [{stat_code}] 응답 파싱 오류: {e}")
+            return {}
+    
+    async def _get_json_async(
+        self,
+        session: 'aiohttp.ClientSession',
+        url: str,
+        label: str,
+        rate_limiter: 'AsyncRateLimiter',
+        semaphore: asyncio.Semaphore,
+        max_attempts: int = 3
+    ) -> Optional[Dict]:
+        """ECOS 비동기 GET (재시도 포함), 실패 시 None"""
+        for attempt in range(max_attempts):
+            try:
+                await rate_limiter.acquire()
+                async with semaphore:
+                    async with session.get(url) as response:
+                        # 429/5xx는 재시도 대상 (본문이 JSON이 아닐 수 있음)
+                        response.raise_for_status()
+                        return json_loads(await response.read())
+            
+            except Exception as e:
+                self.logger.debug(f"BOK [{label}] 오류 (attempt {attempt+1}): {e}")
+                if attempt < max_attempts - 1:
+                    await asyncio.sleep(1.0 * (2 ** attempt))
+        
+        return None
+    
+    async def _fetch_table_async(
+        self,
+        session: 'aiohttp.ClientSession',
+        stat_code: str,
+        freq: str,
+        rate_limiter: 'AsyncRateLimiter',
+        semaphore: asyncio.Semaphore
+    ) -> Dict[str, Optional[Dict]]:
+        """통계표 묶음 지표 최신값 비동기 조회 (_fetch_table과 동일 규칙)"""
+        names = self.SHARED_TABLES[(stat_code, freq)]
+        results = {name: self._get_cached_indicator(self._cache_key(name)) for name in names}
+        missing = tuple(name for name in names if results[name] is None)
+        if not missing:
+            return results
+        
+        data = await self._get_json_async(
+            session, self._build_table_url(stat_code, freq), stat_code, rate_limiter, semaphore
+        )
+        if data is None:
+            return results
+        
+        fetched = self._parse_table_response(missing, data) or {}
+        for name in missing:
+            if name in fetched:
+                results[name] = self._save_indicator(self._cache_key(name), fetched[name])
+            else:
+                results[name] = await self._fetch_indicator_async(session, name, rate_limiter, semaphore)
+        
+        return results
+    
+    async def _fetch_indicator_async(
+        self,
+        session: 'aiohttp.ClientSession',
+        name: str,
+        rate_limiter: 'AsyncRateLimiter',
+        semaphore: asyncio.Semaphore,
+        max_attempts: int = 3
+    ) -> Optional[Dict]:
+        """단일 지표 최신값 비동기 조회 (캐시 우선, 재시도 포함)"""
+        key = self._cache_key(name)
+        cached = self._get_cached_indicator(key)
+        if cached is not None:
+            return cached
+        
+        data = await self._get_json_async(
+            session, self._build_url(name), name, rate_limiter, semaphore, max_attempts
+        )
+        if data is None:
+            return None
+        return self._save_indicator(key, self._parse_response(name, data))
+    
+    async def collect_all_indicators_async(self, max_concurrent: int = 8) -> pd.DataFrame:
+        """모든 지표 최신값 동시 수집 (부분 실패 허용)"""
+        jobs = self._JOBS
+        self.logger.info(f"🇰🇷 BOK 지표 {len(jobs)}개 동시 수집 중...")
+        
+        # 분당 50회 제한 + 동시 요청 수 제한 (커넥션 풀도 같은 크기로 제한)
+        rate_limiter = AsyncRateLimiter(50 / 60)
+        semaphore = asyncio.Semaphore(max_concurrent)
+        connector = aiohttp.TCPConnector(limit=max_concurrent, limit_per_host=max_concurrent)
+        timeout = aiohttp.ClientTimeout(total=15)
+        
+        async with aiohttp.ClientSession(
+            connector=connector,
+            timeout=timeout,
+            headers={'User-Agent': 'KRStockCollector/1.0'}
+        ) as session:
+            # 통계표 묶음은 요청 1회, 나머지는 지표별 요청
+            singles = [name for _, name, *_ in jobs if name not in self._TABLE_OF]
+            fetched = await asyncio.gather(
+                *(self._fetch_table_async(session, stat_code, freq, rate_limiter, semaphore)
+                  for stat_code, freq in self.SHARED_TABLES),
+                *(self._fetch_indicator_async(session, name, rate_limiter, semaphore) for name in singles),
+                return_exceptions=True
+            )
+        
+        results: Dict[str, Optional[Dict]] = {}
+        for table in fetched[:len(self.SHARED_TABLES)]:
+            if isinstance(table, dict):
+                results.update(table)
+        results.update(zip(singles, fetched[len(self.SHARED_TABLES):]))
+        
+        columns = self._new_result_columns()
+        for cat, name, *_ in jobs:
+            data = results.get(name)
+            if data and not isinstance(data, Exception):
+                self._append_result(columns, data, cat)
+        
+        return self._finish_collection(columns, len(jobs))
+    
     def collect_all_indicators(self) -> pd.DataFrame:
-        """모든 지표 최신값 수집 (부분 실패 허용)"""
-        results = []
-        success = 0
-        fail = 0
+        """
+        모든 지표 최신값 수집 (부분 실패 허용)
+        
+        aiohttp가 있고 실행 중인 이벤트 루프가 없으면 지표를 동시에 조회하고,
+        그 외에는 순차 조회한다.
+        """
+        if HAS_AIOHTTP:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return run_async(self.collect_all_indicators_async())
+        
+        columns = self._new_result_columns()
+        tables: Dict[str, Optional[Dict]] = {}
+        current = None
         
-        for cat, indicators in self.CATEGORIES.items():
-            self.logger.info(f"🇰🇷 {cat} 지표 수집 중...")
+        for cat, name, *_ in self._JOBS:
+            if cat != current:
+                current = cat
+                self.logger.info(f"🇰🇷 {cat} 지표 수집 중...")
             
-            for name in indicators:
-                self.logger.info(f"  수집: {name}")
+            self.logger.info(f"  수집: {name}")
+            if name in self._TABLE_OF:
+                # 같은 통계표 지표는 처음 만났을 때 한 번에 조회
+                if name not in tables:
+                    tables.update(self._fetch_table(*self._TABLE_OF[name]))
+                data = tables[name]
+            else:
                 data = self._fetch_indicator(name)
-                if data:
-                    data['category'] = cat
-                    data['source'] = 'BOK'
-                    results.append(data)
-                    success += 1
-                else:
-                    fail += 1
-        
-        self.logger.info(f"BOK 수집 완료: 성공 {success}개 / 실패 {fail}개")
-        
-        if results:
-            df = pd.DataFrame(results)
-            return df
+            if data:
+                self._append_result(columns, data, cat)
+        
+        return self._finish_collection(columns, len(self._JOBS))
+    
+    @staticmethod
+    def _new_result_columns() -> Dict[str, list]:
+        """결과 컬럼별 리스트 (행 dict 대신 컬럼 단위로 누적)"""
+        return {'indicator': [], 'date': [], 'value': [], 'category': [], 'source': []}
+    
+    @staticmethod
+    def _append_result(columns: Dict[str, list], data: Dict, category: str) -> None:
+        """지표 조회 결과 한 건을 컬럼 리스트에 추가"""
+        columns['indicator'].append(data['indicator'])
+        columns['date'].append(data['date'])
+        columns['value'].append(data['value'])
+        columns['category'].append(category)
+        columns['source'].append('BOK')
+    
+    def _finish_collection(self, columns: Dict[str, list], total: int) -> pd.DataFrame:
+        """
+        수집 결과 로깅 및 DataFrame 변환 (컬럼 dict로 한 번에 생성)
+        
+        value는 float64 배열로 미리 만들어 넘긴다 (값 추론 없이 스키마 고정,
+        변환 실패로 0만 있는 경우에도 int64가 되지 않음).
+        """
+        success = len(columns['indicator'])
+        self.logger.info(f"BOK 수집 완료: 성공 {success}개 / 실패 {total - success}개")
+        
+        if success:
+            columns['value'] = np.fromiter(columns['value'], dtype=np.float64, count=success)
+            return pd.DataFrame(columns, copy=False)
         
         self.logger.warning("BOK 지표 수집 결과 없음")
         return pd.DataFrame()
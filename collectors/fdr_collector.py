@@ -7,8 +7,12 @@ FinanceDataReader 기반 수집기
 
 import FinanceDataReader as fdr
 import pandas as pd
-from typing import List, Optional
+from typing import Callable, List, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+import threading
+import time
 import logging
 
 from .base_collector import BaseCollector
@@ -23,6 +27,9 @@ class FDRCollector(BaseCollector):
     무료 API로 KRX 전 종목 데이터 수집
     """
     
+    # 메모리 캐시 최대 항목 수 (디스크 캐시 앞단, LRU)
+    MEMORY_CACHE_SIZE = 512
+    
     def __init__(self, cache_dir: str = "cache"):
         super().__init__(
             name="fdr",
@@ -30,6 +37,57 @@ class FDRCollector(BaseCollector):
             cache_expiry_days=1,  # 주가 데이터는 1일 캐시
             rate_limit_per_minute=300  # 무료 API이므로 제한 느슨
         )
+        self._mem_cache: OrderedDict = OrderedDict()
+        self._mem_lock = threading.Lock()
+    
+    def _get_from_memory(self, key: str) -> Optional[pd.DataFrame]:
+        """
+        메모리 캐시 조회 (복원된 DataFrame 재사용, 호출자 수정에 대비해 사본 반환)
+        
+        저장 후 cache_expiry_days가 지난 항목은 제거하고 미스로 처리한다.
+        """
+        with self._mem_lock:
+            entry = self._mem_cache.get(key)
+            if entry is None:
+                return None
+            
+            saved_at, df = entry
+            if time.monotonic() - saved_at > self.cache_expiry_days * 86400:
+                del self._mem_cache[key]
+                return None
+            self._mem_cache.move_to_end(key)
+        return df.copy()
+    
+    def _save_to_memory(self, key: str, df: pd.DataFrame) -> pd.DataFrame:
+        """메모리 캐시 저장 (저장 시각 기록, 최대 크기 초과 시 가장 오래 안 쓴 항목 제거)"""
+        with self._mem_lock:
+            self._mem_cache[key] = (time.monotonic(), df.copy())
+            self._mem_cache.move_to_end(key)
+            while len(self._mem_cache) > self.MEMORY_CACHE_SIZE:
+                self._mem_cache.popitem(last=False)
+        return df
+    
+    def _load_frame(self, key: str) -> Optional[pd.DataFrame]:
+        """메모리 → Parquet 캐시 순으로 DataFrame 조회"""
+        df = self._get_from_memory(key)
+        if df is not None:
+            return df
+        
+        df = self._get_frame_from_cache(key)
+        if df is not None:
+            return self._save_to_memory(key, df)
+        return None
+    
+    def _store_frame(self, key: str, df: pd.DataFrame, records: Optional[Callable[[], list]] = None) -> pd.DataFrame:
+        """
+        DataFrame 캐시 저장 (Parquet 우선, 불가 시 JSON 레코드)
+        
+        Args:
+            records: JSON 캐시용 레코드 생성 함수 (None이면 df.to_dict('records'))
+        """
+        if not self._save_frame_to_cache(key, df):
+            self._save_to_cache(key, df.to_dict('records') if records is None else records())
+        return self._save_to_memory(key, df)
     
     def get_all_stock_list(self, market: str = 'KRX') -> pd.DataFrame:
         """
@@ -46,18 +104,20 @@ class FDRCollector(BaseCollector):
             - Sector: 업종
         """
         cache_key = f"stock_list_{market}"
+        df = self._load_frame(cache_key)
+        if df is not None:
+            return df
+        
         cached = self._get_from_cache(cache_key)
         if cached is not None:
-            return pd.DataFrame(cached)
+            return self._save_to_memory(cache_key, pd.DataFrame(cached))
         
         try:
             df = fdr.StockListing(market)
             self.logger.info(f"{market} 상장종목 {len(df)}개 조회")
             
             # 캐시 저장
-            self._save_to_cache(cache_key, df.to_dict('records'))
-            
-            return df
+            return self._store_frame(cache_key, df)
             
         except Exception as e:
             self.logger.error(f"종목 리스트 조회 실패: {e}")
@@ -84,21 +144,27 @@ class FDRCollector(BaseCollector):
             end = datetime.now().strftime('%Y-%m-%d')
         
         cache_key = f"price_{stock_code}_{start}_{end}"
+        df = self._load_frame(cache_key)
+        if df is not None:
+            return df
+        
         cached = self._get_from_cache(cache_key)
         if cached is not None:
+            # JSON 캐시 (pyarrow 미설치): ISO 날짜 문자열을 C 파서로 바로 인덱스 변환
             df = pd.DataFrame(cached)
-            df['Date'] = pd.to_datetime(df['Date'])
-            df = df.set_index('Date')
-            return df
+            df.index = pd.DatetimeIndex(pd.to_datetime(df.pop('Date'), format='ISO8601'), name='Date')
+            return self._save_to_memory(cache_key, df)
         
         try:
+            # 캐시 미스일 때만 호출 한도 소모 (get_all_prices_batch 스레드도 여기서 함께 제한됨)
+            if not self.rate_limiter.wait():
+                raise Exception("일일 호출 한도 초과")
+            
             df = fdr.DataReader(stock_code, start, end)
             
             if not df.empty:
-                # 캐시 저장 (인덱스 리셋)
-                cache_df = df.reset_index()
-                cache_df['Date'] = cache_df['Date'].astype(str)
-                self._save_to_cache(cache_key, cache_df.to_dict('records'))
+                # 캐시 저장 (JSON은 인덱스 리셋 + 날짜 문자열)
+                self._store_frame(cache_key, df, lambda: self._price_records(df))
             
             return df
             
@@ -106,19 +172,32 @@ class FDRCollector(BaseCollector):
             self.logger.warning(f"주가 조회 실패 [{stock_code}]: {e}")
             return pd.DataFrame()
     
+    @staticmethod
+    def _price_records(df: pd.DataFrame) -> list:
+        """주가 DataFrame → JSON 캐시 레코드 (pyarrow 미설치 시)"""
+        cache_df = df.reset_index()
+        cache_df['Date'] = cache_df['Date'].astype(str)
+        return cache_df.to_dict('records')
+    
     def get_all_prices_batch(
         self,
         stock_codes: List[str],
         start: str,
-        end: str = None
+        end: str = None,
+        max_workers: int = 8
     ) -> pd.DataFrame:
         """
         전 종목 주가 일괄 조회
         
+        종목별 조회는 네트워크 대기가 대부분이므로 스레드 풀로 동시에 요청하고,
+        결과는 입력 종목 순서대로 합친다. 실제 요청은 스레드 수와 관계없이
+        get_price_history 안의 rate_limiter로 분당 호출 수가 제한된다.
+        
         Args:
             stock_codes: 종목코드 리스트
             start: 시작일
             end: 종료일
+            max_workers: 동시 조회 스레드 수
         
         Returns:
             통합 주가 DataFrame
@@ -126,22 +205,31 @@ class FDRCollector(BaseCollector):
         if end is None:
             end = datetime.now().strftime('%Y-%m-%d')
         
-        all_data = []
+        frames: List[Optional[pd.DataFrame]] = [None] * len(stock_codes)
         total = len(stock_codes)
         
-        for i, code in enumerate(stock_codes):
-            if (i + 1) % 100 == 0:
-                self.logger.info(f"주가 조회 진행: {i+1}/{total}")
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, total or 1))) as executor:
+            futures = {
+                executor.submit(self.get_price_history, code, start, end): i
+                for i, code in enumerate(stock_codes)
+            }
             
-            try:
-                df = self.get_price_history(code, start, end)
-                if not df.empty:
-                    df = df.reset_index()
-                    df['stock_code'] = code
-                    all_data.append(df)
-            except Exception as e:
-                self.logger.warning(f"주가 조회 실패 [{code}]: {e}")
+            for done, future in enumerate(as_completed(futures), 1):
+                if done % 100 == 0:
+                    self.logger.info(f"주가 조회 진행: {done}/{total}")
+                
+                i = futures[future]
+                code = stock_codes[i]
+                try:
+                    df = future.result()
+                    if not df.empty:
+                        df = df.reset_index()
+                        df['stock_code'] = code
+                        frames[i] = df
+                except Exception as e:
+                    self.logger.warning(f"주가 조회 실패 [{code}]: {e}")
         
+        all_data = [df for df in frames if df is not None]
         if not all_data:
             return pd.DataFrame()
         
@@ -161,17 +249,20 @@ class FDRCollector(BaseCollector):
             시가총액 DataFrame
         """
         cache_key = f"marcap_{date or 'latest'}"
+        df = self._load_frame(cache_key)
+        if df is not None:
+            return df
+        
         cached = self._get_from_cache(cache_key)
         if cached is not None:
-            return pd.DataFrame(cached)
+            return self._save_to_memory(cache_key, pd.DataFrame(cached))
         
         try:
             df = fdr.StockListing('KRX-MARCAP')
             
-            self._save_to_cache(cache_key, df.to_dict('records'))
             self.logger.info(f"시가총액 데이터 {len(df)}개 조회")
             
-            return df
+            return self._store_frame(cache_key, df)
             
         except Exception as e:
             self.logger.error(f"시가총액 조회 실패: {e}")
@@ -3,26 +3,54 @@ FRED API 수집기 (글로벌 확장 v3)
 - 50개+ 글로벌 경제지표
 - DAX, 니케이, 항셍, 상해, KOSPI 포함
 - 최신값만 반환
+- 지표 동시 조회 (aiohttp)
 """
 
+import asyncio
 import requests
+import numpy as np
 import pandas as pd
-from typing import Optional, Dict, List
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from types import MappingProxyType
+from typing import Optional, Dict, List, Mapping, Tuple
 from datetime import datetime, timedelta
 import logging
+import time
+from urllib.parse import urlencode
 
-from .base_collector import BaseCollector, retry
+from .base_collector import BaseCollector, retry, HAS_HTTPX, HAS_HTTP2
+from utils.json_codec import json_dumps, json_loads
+
+try:
+    import aiohttp
+    from .async_base import AsyncRateLimiter, run_async
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
 
 logger = logging.getLogger("kr_stock_collector.fred")
 
 
+def _flatten_jobs(categories: Mapping[str, Tuple[str, ...]], series: Mapping[str, str]) -> tuple:
+    """(카테고리, 지표명, 시리즈ID) 수집 일정 (SERIES에 없는 지표 제외)"""
+    return tuple(
+        (cat, name, series[name])
+        for cat, names in categories.items()
+        for name in names
+        if name in series
+    )
+
+
 class FREDCollector(BaseCollector):
     """FRED API 수집기 (50개+ 글로벌 지표)"""
     
     BASE_URL = "https://api.stlouisfed.org/fred/series/observations"
     
+    # 조건부 요청(ETag/Last-Modified)용 검증값과 본문 보존 일수 (TTL 만료 후 재검증에 사용)
+    REVALIDATE_DAYS = 30
+    
     # ===== 50개+ 글로벌 경제지표 =====
-    SERIES = {
+    SERIES = MappingProxyType({
         # 글로벌 주요 지수 (10개)
         'S&P500': 'SP500',
         '나스닥': 'NASDAQCOM',
@@ -87,18 +115,35 @@ class FREDCollector(BaseCollector):
         'TED스프레드': 'TEDRATE',
         'LIBOR-OIS': 'USDONTD156N',
         'BBB스프레드': 'BAMLC0A4CBBB',
-    }
-    
-    CATEGORIES = {
-        '글로벌지수': ['S&P500', '나스닥', '다우존스', 'VIX(공포지수)', 
-                     '니케이225(일본)', 'DAX(독일)', '항셍(홍콩)', '상해종합(중국)', 'KOSPI(한국)'],
-        '미국금리': ['Fed기준금리', 'SOFR', '미국채2Y', '미국채10Y', '미국채30Y', 
-                   '10Y-2Y스프레드', '10Y-3M스프레드'],
-        '원자재': ['WTI원유', 'Brent원유', '천연가스', '금', '은', '구리'],
-        '환율': ['달러인덱스(DXY)', 'EUR/USD', 'USD/JPY', 'USD/CNY', 'USD/KRW', '비트코인'],
-        '글로벌경제': ['미국GDP', '미국CPI', '미국실업률', '미국소비자신뢰', '중국PMI'],
-        '신용리스크': ['HY스프레드', 'IG스프레드', 'TED스프레드', 'BBB스프레드'],
-    }
+    })
+    
+    CATEGORIES = MappingProxyType({
+        '글로벌지수': ('S&P500', '나스닥', '다우존스', 'VIX(공포지수)', 
+                     '니케이225(일본)', 'DAX(독일)', '항셍(홍콩)', '상해종합(중국)', 'KOSPI(한국)'),
+        '미국금리': ('Fed기준금리', 'SOFR', '미국채2Y', '미국채10Y', '미국채30Y', 
+                   '10Y-2Y스프레드', '10Y-3M스프레드'),
+        '원자재': ('WTI원유', 'Brent원유', '천연가스', '금', '은', '구리'),
+        '환율': ('달러인덱스(DXY)', 'EUR/USD', 'USD/JPY', 'USD/CNY', 'USD/KRW', '비트코인'),
+        '글로벌경제': ('미국GDP', '미국CPI', '미국실업률', '미국소비자신뢰', '중국PMI'),
+        '신용리스크': ('HY스프레드', 'IG스프레드', 'TED스프레드', 'BBB스프레드'),
+    })
+    
+    # 시리즈별 캐시 유효 시간 (발표 주기 기준, 목록에 없으면 DEFAULT_TTL_HOURS)
+    DEFAULT_TTL_HOURS = 24
+    SERIES_TTL_HOURS = MappingProxyType({
+        # 월간
+        **{series_id: 24 * 3 for series_id in (
+            'FEDFUNDS', 'CPIAUCSL', 'CPILFESL', 'UNRATE', 'INDPRO', 'UMCSENT',
+            'MPMIBZ01CNM486S', 'CP0000EZ19M086NEST',
+            'PCOPPUSDM', 'PALUMUSDM', 'PMAIZMTUSDM', 'PSOYBUSDM', 'PWHEAMTUSDM',
+        )},
+        # 분기
+        'GDP': 24 * 7,
+    })
+    
+    # 지표명 ↔ 시리즈ID 역색인, 수집 일정 (클래스 정의 시 한 번만 계산)
+    SERIES_NAMES = MappingProxyType({series_id: name for name, series_id in SERIES.items()})
+    _JOBS = _flatten_jobs(CATEGORIES, SERIES)
     
     def __init__(self, api_key: str, cache_dir: str = "cache"):
         super().__init__(
@@ -108,54 +153,39 @@ class FREDCollector(BaseCollector):
             rate_limit_per_minute=100
         )
         self.api_key = api_key
-    
-    @retry(max_attempts=2, delay=0.3)
-    def _fetch_latest(self, series_id: str) -> Optional[Dict]:
-        """시리즈 최신값 조회"""
-        params = {
-            'series_id': series_id,
-            'api_key': self.api_key,
+        # 고정 쿼리(api_key 등)는 인스턴스 생성 시 한 번만 인코딩
+        self._url_prefix = f"{self.BASE_URL}?" + urlencode({
+            'api_key': api_key,
             'file_type': 'json',
             'sort_order': 'desc',
-            'limit': 1,
-        }
+        })
+        self._memo: Dict[str, Tuple[float, Dict]] = {}   # 프로세스 내 캐시 (디스크 캐시 앞단): 키 → (만료 시각, 응답)
+    
+    def _build_url(self, series_id: str, limit: int) -> str:
+        """최신순 관측치 조회 URL (시리즈ID는 영숫자라 인코딩 불필요)"""
+        return f"{self._url_prefix}&series_id={series_id}&limit={limit}"
+    
+    @staticmethod
+    def _parse_latest(data: Dict) -> Optional[Dict]:
+        """응답에서 최신값 추출 (결측 '.'이면 None)"""
+        observations = data.get('observations', [])
+        if not observations:
+            return None
         
-        try:
-            response = self._make_request('GET', self.BASE_URL, params=params, timeout=10)
-            data = response.json()
-            
-            observations = data.get('observations', [])
-            if not observations:
-                return None
-            
-            latest = observations[0]
-            value = latest.get('value', '.')
-            if value == '.':
-                return None
-            
-            return {
-                'date': latest['date'],
-                'value': float(value),
-            }
-            
-        except Exception as e:
-            self.logger.warning(f"FRED [{series_id}]: {e}")
+        latest = observations[0]
+        value = latest.get('value', '.')
+        if value == '.':
             return None
-    
-    def _get_yoy(self, series_id: str) -> Optional[float]:
-        """전년대비 변화율 (물가용)"""
-        params = {
-            'series_id': series_id,
-            'api_key': self.api_key,
-            'file_type': 'json',
-            'sort_order': 'desc',
-            'limit': 13,
-        }
         
+        return {
+            'date': latest['date'],
+            'value': float(value),
+        }
+    
+    @staticmethod
+    def _parse_yoy(data: Dict) -> Optional[float]:
+        """최근 13개 관측치로 전년대비 변화율 계산"""
         try:
-            response = self._make_request('GET', self.BASE_URL, params=params, timeout=10)
-            data = response.json()
-            
             observations = data.get('observations', [])
             if len(observations) < 2:
                 return None
@@ -170,44 +200,337 @@ class FREDCollector(BaseCollector):
             pass
         return None
     
-    def collect_all_indicators(self) -> pd.DataFrame:
-        """모든 지표 최신값 수집"""
-        results = []
+    @staticmethod
+    def _needs_yoy(name: str) -> bool:
+        """물가 지표는 YoY 추가"""
+        return 'CPI' in name or 'PPI' in name
+    
+    @classmethod
+    def _page_size(cls, name: str) -> int:
+        """조회할 관측치 수 (YoY 지표는 13개 한 번으로 최신값과 1년 전 값을 함께 받음)"""
+        return 13 if cls._needs_yoy(name) else 1
+    
+    @classmethod
+    def _parse_indicator(cls, name: str, data: Dict) -> tuple:
+        """응답 하나에서 (최신값, YoY) 추출"""
+        latest = cls._parse_latest(data)
+        if latest is None or not cls._needs_yoy(name):
+            return latest, None
+        return latest, cls._parse_yoy(data)
+    
+    def _ttl_days(self, series_id: str) -> float:
+        """시리즈 응답 캐시 유효 기간 (일)"""
+        return self.SERIES_TTL_HOURS.get(series_id, self.DEFAULT_TTL_HOURS) / 24
+    
+    @staticmethod
+    def _cache_key(series_id: str, limit: int) -> str:
+        return f"fred_{series_id}_{limit}"
+    
+    def _read_payload(self, series_id: str, limit: int) -> Optional[Dict]:
+        """
+        메모리 → 디스크 순으로 캐시된 응답 조회 (둘 다 시리즈별 TTL 적용)
+        
+        디스크 본문은 검증값과 함께 더 오래 보존되므로, 유효 여부는 본문과 별도로
+        TTL 동안만 남는 {key}.fresh 항목의 만료 시각으로 판단한다.
+        """
+        key = self._cache_key(series_id, limit)
+        memo = self._memo.get(key)
+        if memo is not None:
+            if memo[0] > time.time():
+                return memo[1]
+            # 만료된 항목은 미스로 처리 (디스크 캐시 → 조건부 요청 → 새 조회 순으로 진행)
+            self._memo.pop(key, None)
+        
+        try:
+            fresh = self._read_cache_entry(f"{key}.fresh")
+            if fresh is None:
+                return None
+            blob = self._read_cache_blob(key)
+            if blob is None:
+                return None
+            # 메모리 항목은 디스크 유효 기간보다 오래 살지 않음
+            data = json_loads(blob)
+            self._memo[key] = (fresh[1], data)
+            return data
+        except Exception as e:
+            self.logger.warning(f"캐시 읽기 실패: {e}")
+            return None
+    
+    def _store_payload(
+        self,
+        series_id: str,
+        limit: int,
+        body: bytes,
+        data: Dict,
+        validators: Optional[Dict] = None
+    ) -> None:
+        """
+        관측치가 있는 응답만 메모리/디스크 캐시에 저장 (디스크는 재직렬화 없이 본문 bytes)
+        
+        ETag/Last-Modified가 있으면 본문을 REVALIDATE_DAYS 동안 보존하고 검증값만 따로 저장해
+        TTL 만료 후 조건부 요청에 사용한다.
+        """
+        if not data.get('observations'):
+            return
+        key = self._cache_key(series_id, limit)
+        ttl_days = self._ttl_days(series_id)
+        revalidate = bool(validators and (validators['etag'] or validators['last_modified']))
+        self._memo[key] = (time.time() + ttl_days * 86400, data)
+        try:
+            self._write_cache_blob(key, body, expiry_days=self.REVALIDATE_DAYS if revalidate else ttl_days)
+            self._write_cache_blob(f"{key}.fresh", b'', expiry_days=ttl_days)
+            if revalidate:
+                self._write_cache_blob(
+                    f"{key}.validators",
+                    json_dumps({'etag': validators['etag'], 'last_modified': validators['last_modified']}),
+                    expiry_days=self.REVALIDATE_DAYS
+                )
+        except Exception as e:
+            self.logger.warning(f"캐시 저장 실패: {e}")
+    
+    def _read_validators(self, series_id: str, limit: int) -> Optional[Dict]:
+        """
+        만료된 응답의 검증값 + 보존된 본문 ({'etag', 'last_modified', 'body'}), 없으면 None
+        
+        본문은 디스크에 한 번만 저장되며 여기서 bytes 그대로 붙여 304 응답 처리에 사용한다.
+        """
+        key = self._cache_key(series_id, limit)
+        try:
+            blob = self._read_cache_blob(f"{key}.validators")
+            if blob is None:
+                return None
+            body = self._read_cache_blob(key)
+            if body is None:
+                return None
+            validators = json_loads(blob)
+            return {'etag': validators.get('etag'), 'last_modified': validators.get('last_modified'), 'body': body}
+        except Exception as e:
+            self.logger.warning(f"캐시 읽기 실패: {e}")
+            return None
+    
+    @staticmethod
+    def _conditional_headers(previous: Optional[Dict]) -> Optional[Dict]:
+        """이전 응답 검증값으로 If-None-Match/If-Modified-Since 헤더 구성"""
+        if not previous:
+            return None
+        headers = {}
+        if previous.get('etag'):
+            headers['If-None-Match'] = previous['etag']
+        if previous.get('last_modified'):
+            headers['If-Modified-Since'] = previous['last_modified']
+        return headers or None
+    
+    @staticmethod
+    def _response_validators(headers: Mapping, previous: Optional[Dict] = None) -> Dict:
+        """응답 헤더의 ETag/Last-Modified (304 응답에 빠져 있으면 이전 값 유지)"""
+        previous = previous or {}
+        return {
+            'etag': headers.get('ETag') or previous.get('etag'),
+            'last_modified': headers.get('Last-Modified') or previous.get('last_modified'),
+        }
+    
+    def _accept_response(
+        self,
+        series_id: str,
+        limit: int,
+        status: int,
+        body: bytes,
+        headers: Mapping,
+        previous: Optional[Dict]
+    ) -> Dict:
+        """응답 처리: 304면 보존된 이전 본문 재사용, 아니면 새 본문 파싱 → 캐시 갱신"""
+        if status == 304 and previous:
+            body = previous['body']
+            data = json_loads(body)
+            self._store_payload(series_id, limit, body, data, self._response_validators(headers, previous))
+            return data
+        
+        data = json_loads(body)
+        self._store_payload(series_id, limit, body, data, self._response_validators(headers))
+        return data
+    
+    @retry(max_attempts=2, delay=0.3)
+    def _request_payload(self, series_id: str, limit: int, headers: Optional[Dict] = None):
+        return self._make_request('GET', self._build_url(series_id, limit), headers=headers, timeout=10)
+    
+    def _get_observations(self, series_id: str, limit: int) -> Dict:
+        """최신순 관측치 응답 (캐시 우선, 만료된 경우 검증값이 있으면 조건부 요청)"""
+        data = self._read_payload(series_id, limit)
+        if data is None:
+            previous = self._read_validators(series_id, limit)
+            response = self._request_payload(series_id, limit, self._conditional_headers(previous))
+            data = self._accept_response(
+                series_id, limit, response.status_code, response.content, response.headers, previous
+            )
+        return data
+    
+    def _fetch_indicator(self, name: str, series_id: str) -> tuple:
+        """지표 최신값 (+ 물가 지표 YoY) 조회 → (최신값, YoY)"""
+        try:
+            return self._parse_indicator(name, self._get_observations(series_id, self._page_size(name)))
+        
+        except Exception as e:
+            self.logger.warning(f"FRED [{series_id}]: {e}")
+            return None, None
+    
+    async def _get_observations_async(
+        self,
+        session: 'aiohttp.ClientSession',
+        series_id: str,
+        limit: int,
+        rate_limiter: 'AsyncRateLimiter',
+        semaphore: asyncio.Semaphore,
+        max_attempts: int = 2
+    ) -> Optional[Dict]:
+        """최신순 관측치 비동기 조회 (캐시 우선, 재시도 포함), 실패 시 None"""
+        data = self._read_payload(series_id, limit)
+        if data is not None:
+            return data
         
-        for cat, indicators in self.CATEGORIES.items():
-            self.logger.info(f"🌍 {cat} 지표 수집 중...")
+        url = self._build_url(series_id, limit)
+        previous = self._read_validators(series_id, limit)
+        headers = self._conditional_headers(previous)
+        for attempt in range(max_attempts):
+            try:
+                await rate_limiter.acquire()
+                async with semaphore:
+                    async with session.get(url, headers=headers) as response:
+                        # 429/5xx는 재시도 대상 (본문이 JSON이 아닐 수 있음)
+                        response.raise_for_status()
+                        body = await response.read()
+                return self._accept_response(
+                    series_id, limit, response.status, body, response.headers, previous
+                )
             
-            for name in indicators:
-                if name not in self.SERIES:
-                    continue
-                
-                self.logger.info(f"  수집: {name}")
-                series_id = self.SERIES[name]
-                data = self._fetch_latest(series_id)
-                
-                if data:
-                    result = {
-                        'indicator': name,
-                        'date': data['date'],
-                        'value': data['value'],
-                        'category': cat,
-                    }
-                    
-                    # 물가는 YoY 추가
-                    if 'CPI' in name or 'PPI' in name:
-                        yoy = self._get_yoy(series_id)
-                        if yoy:
-                            result['yoy_pct'] = yoy
-                    
-                    results.append(result)
-        
-        if results:
-            df = pd.DataFrame(results)
-            df['source'] = 'FRED'
-            self.logger.info(f"✓ 총 {len(df)}개 글로벌 지표 수집")
-            return df
-        
-        return pd.DataFrame()
+            except Exception as e:
+                self.logger.debug(f"FRED [{series_id}] 오류 (attempt {attempt+1}): {e}")
+                if attempt < max_attempts - 1:
+                    await asyncio.sleep(0.3 * (2 ** attempt))
+        
+        self.logger.warning(f"FRED [{series_id}]: 조회 실패")
+        return None
+    
+    async def _fetch_indicator_async(
+        self,
+        session: 'aiohttp.ClientSession',
+        name: str,
+        series_id: str,
+        rate_limiter: 'AsyncRateLimiter',
+        semaphore: asyncio.Semaphore
+    ) -> tuple:
+        """지표 최신값 (+ 물가 지표 YoY) 비동기 조회 → (최신값, YoY)"""
+        data = await self._get_observations_async(
+            session, series_id, self._page_size(name), rate_limiter, semaphore
+        )
+        return self._parse_indicator(name, data) if data else (None, None)
+    
+    async def collect_all_indicators_async(self, max_concurrent: int = 8) -> pd.DataFrame:
+        """모든 지표 최신값 동시 수집 (부분 실패 허용)"""
+        jobs = self._JOBS
+        self.logger.info(f"🌍 FRED 지표 {len(jobs)}개 동시 수집 중...")
+        
+        # 분당 호출 제한 + 동시 요청 수 제한 (커넥션 풀도 같은 크기로 제한)
+        rate_limiter = AsyncRateLimiter(self.rate_limiter.calls_per_minute / 60)
+        semaphore = asyncio.Semaphore(max_concurrent)
+        connector = aiohttp.TCPConnector(limit=max_concurrent, limit_per_host=max_concurrent)
+        timeout = aiohttp.ClientTimeout(total=10)
+        
+        async with aiohttp.ClientSession(
+            connector=connector,
+            timeout=timeout,
+            headers={'User-Agent': 'KRStockCollector/1.0'}
+        ) as session:
+            fetched = await asyncio.gather(
+                *(self._fetch_indicator_async(session, name, series_id, rate_limiter, semaphore)
+                  for _, name, series_id in jobs),
+                return_exceptions=True
+            )
+        
+        columns = self._new_result_columns()
+        for (cat, name, _), item in zip(jobs, fetched):
+            if isinstance(item, Exception):
+                continue
+            data, yoy = item
+            if data:
+                self._append_result(columns, name, cat, data, yoy)
+        
+        return self._finish_collection(columns)
+    
+    def collect_all_indicators(self, max_workers: int = 8) -> pd.DataFrame:
+        """
+        모든 지표 최신값 수집
+        
+        공유 세션이 HTTP/2(httpx + h2)면 스레드 풀로 한 연결에 요청을 다중화하고,
+        아니면 aiohttp가 있고 실행 중인 이벤트 루프가 없을 때 비동기로 동시에 조회한다.
+        그 외에는 스레드 풀 + 공유 세션(HTTP/1.1 커넥션 풀)을 쓴다. rate limiter는 모두 스레드/태스크 안전.
+        결과는 어느 경로든 CATEGORIES 순서를 따른다.
+        
+        Args:
+            max_workers: 동시 조회 수
+        """
+        if HAS_AIOHTTP and not (HAS_HTTPX and HAS_HTTP2):
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return run_async(self.collect_all_indicators_async(max_workers))
+        
+        jobs = self._JOBS
+        self.logger.info(f"🌍 FRED 지표 {len(jobs)}개 수집 중...")
+        fetched: List[tuple] = [(None, None)] * len(jobs)
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(jobs) or 1))) as executor:
+            futures = {
+                executor.submit(self._fetch_indicator, name, series_id): i
+                for i, (_, name, series_id) in enumerate(jobs)
+            }
+            for future in as_completed(futures):
+                fetched[futures[future]] = future.result()
+        
+        columns = self._new_result_columns()
+        for (cat, name, _), (data, yoy) in zip(jobs, fetched):
+            if data:
+                self._append_result(columns, name, cat, data, yoy)
+        
+        return self._finish_collection(columns)
+    
+    @staticmethod
+    def _new_result_columns() -> Dict[str, list]:
+        """결과 컬럼별 리스트 (행 dict 대신 컬럼 단위로 누적)"""
+        return {'indicator': [], 'date': [], 'value': [], 'category': [], 'yoy_pct': []}
+    
+    @staticmethod
+    def _append_result(
+        columns: Dict[str, list],
+        name: str,
+        category: str,
+        data: Dict,
+        yoy: Optional[float]
+    ) -> None:
+        """지표 조회 결과 한 건을 컬럼 리스트에 추가 (YoY 없으면 NaN)"""
+        columns['indicator'].append(name)
+        columns['date'].append(data['date'])
+        columns['value'].append(data['value'])
+        columns['category'].append(category)
+        columns['yoy_pct'].append(yoy if yoy else np.nan)
+    
+    def _finish_collection(self, columns: Dict[str, list]) -> pd.DataFrame:
+        """
+        수집 결과 DataFrame 변환 (컬럼 dict로 한 번에 생성)
+        
+        수치 컬럼은 float64 배열로 미리 만들어 넘긴다. yoy_pct는 YoY가 하나라도 있을 때만 포함.
+        """
+        count = len(columns['indicator'])
+        if not count:
+            return pd.DataFrame()
+        
+        columns['value'] = np.fromiter(columns['value'], dtype=np.float64, count=count)
+        yoy = np.fromiter(columns.pop('yoy_pct'), dtype=np.float64, count=count)
+        if not np.isnan(yoy).all():
+            columns['yoy_pct'] = yoy
+        columns['source'] = 'FRED'
+        
+        self.logger.info(f"✓ 총 {count}개 글로벌 지표 수집")
+        return pd.DataFrame(columns, copy=False)
     
     def collect(self, start: str = None, end: str = None, categories: List[str] = None) -> pd.DataFrame:
         """BaseCollector 인터페이스"""
@@ -3,14 +3,16 @@
 주요 기능: 실시간 시세, 일봉/주봉, 투자지표
 """
 
-import requests
 import json
+import os
+import tempfile
 from datetime import datetime, timedelta
 from typing import Optional, Dict, List
 import pandas as pd
 import logging
 
 from .base_collector import BaseCollector, retry
+from utils.json_codec import json_loads
 
 logger = logging.getLogger("kr_stock_collector.kis")
 
@@ -25,6 +27,24 @@ class KISCollector(BaseCollector):
     
     BASE_URL = "https://openapi.koreainvestment.com:9443"
     
+    # 토큰 파일 (cache_dir 기준), 만료 전 여유 시간
+    TOKEN_FILE = "kis_token.json"
+    TOKEN_MARGIN = timedelta(minutes=5)
+    
+    # 관심종목(멀티종목) 시세 조회 1회당 최대 종목 수
+    MULTI_PRICE_MAX = 30
+    
+    # 멀티종목 시세 필드명 → 현재가 시세(inquire-price) 필드명 (prdy_ctrt, acml_vol 등은 동일)
+    MULTI_PRICE_FIELDS = {
+        'inter2_prpr': 'stck_prpr',        # 현재가
+        'inter2_prdy_vrss': 'prdy_vrss',   # 전일 대비
+        'inter2_oprc': 'stck_oprc',        # 시가
+        'inter2_hgpr': 'stck_hgpr',        # 고가
+        'inter2_lwpr': 'stck_lwpr',        # 저가
+        'inter2_mxpr': 'stck_mxpr',        # 상한가
+        'inter2_llam': 'stck_llam',        # 하한가
+    }
+    
     def __init__(
         self,
         app_key: str,
@@ -47,6 +67,55 @@ class KISCollector(BaseCollector):
         self.app_secret = app_secret
         self.access_token: Optional[str] = None
         self.token_expires: Optional[datetime] = None
+        self._token_path = os.path.join(cache_dir, self.TOKEN_FILE)
+        self._load_token()
+        
+        # 모든 요청은 커넥션 풀을 쓰는 공유 세션으로 (앱 키는 세션 기본 헤더)
+        self._session.headers.update({
+            "appkey": app_key,
+            "appsecret": app_secret
+        })
+    
+    def _load_token(self) -> None:
+        """
+        디스크에 저장된 토큰 복원 (재시작/다른 프로세스에서 재발급 방지)
+        
+        같은 AppKey로 발급되었고 만료까지 TOKEN_MARGIN 이상 남은 경우에만 사용한다.
+        """
+        try:
+            with open(self._token_path, encoding='utf-8') as f:
+                saved = json.load(f)
+            
+            expires = datetime.fromisoformat(saved['expires'])
+            if saved.get('app_key') == self.app_key and datetime.now() < expires - self.TOKEN_MARGIN:
+                self.access_token = saved['access_token']
+                self.token_expires = expires
+                self.logger.debug("KIS 저장된 토큰 사용")
+        
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.warning(f"KIS 토큰 파일 읽기 실패: {e}")
+    
+    def _save_token(self) -> None:
+        """토큰 저장 (소유자만 읽기/쓰기, 임시 파일 작성 후 교체로 원자적 갱신)"""
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self._token_path) or '.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'app_key': self.app_key,
+                    'access_token': self.access_token,
+                    'expires': self.token_expires.isoformat(),
+                }, f)
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, self._token_path)
+        
+        except Exception as e:
+            self.logger.warning(f"KIS 토큰 파일 저장 실패: {e}")
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
     
     def _get_token(self) -> str:
         """
@@ -69,13 +138,14 @@ class KISCollector(BaseCollector):
         }
         
         try:
-            response = requests.post(url, headers=headers, json=body, timeout=30)
-            data = response.json()
+            response = self._session.post(url, headers=headers, json=body, timeout=30)
+            data = json_loads(response.content)
             
             if 'access_token' in data:
                 self.access_token = data['access_token']
                 # 23시간 후 만료 (여유 확보)
                 self.token_expires = datetime.now() + timedelta(hours=23)
+                self._save_token()
                 self.logger.info("KIS 토큰 발급 완료")
                 return self.access_token
             else:
@@ -88,7 +158,7 @@ class KISCollector(BaseCollector):
     
     def _get_headers(self, tr_id: str) -> Dict:
         """
-        API 호출 헤더 생성
+        API 호출 헤더 생성 (appkey/appsecret은 세션 기본 헤더)
         
         Args:
             tr_id: 거래 ID (API 엔드포인트별 고유값)
@@ -96,8 +166,6 @@ class KISCollector(BaseCollector):
         return {
             "Content-Type": "application/json; charset=utf-8",
             "authorization": f"Bearer {self._get_token()}",
-            "appkey": self.app_key,
-            "appsecret": self.app_secret,
             "tr_id": tr_id
         }
     
@@ -123,8 +191,8 @@ class KISCollector(BaseCollector):
             if not self.rate_limiter.wait():
                 raise Exception("일일 호출 한도 초과")
             
-            response = requests.get(url, headers=headers, params=params, timeout=30)
-            data = response.json()
+            response = self._session.get(url, headers=headers, params=params, timeout=30)
+            data = json_loads(response.content)
             
             if data.get('rt_cd') == '0':
                 return data.get('output', {})
@@ -169,8 +237,8 @@ class KISCollector(BaseCollector):
             if not self.rate_limiter.wait():
                 raise Exception("일일 호출 한도 초과")
             
-            response = requests.get(url, headers=headers, params=params, timeout=30)
-            data = response.json()
+            response = self._session.get(url, headers=headers, params=params, timeout=30)
+            data = json_loads(response.content)
             
             if data.get('rt_cd') == '0':
                 output = data.get('output', [])
@@ -210,8 +278,8 @@ class KISCollector(BaseCollector):
             if not self.rate_limiter.wait():
                 raise Exception("일일 호출 한도 초과")
             
-            response = requests.get(url, headers=headers, params=params, timeout=30)
-            data = response.json()
+            response = self._session.get(url, headers=headers, params=params, timeout=30)
+            data = json_loads(response.content)
             
             if data.get('rt_cd') == '0':
                 output = data.get('output', [])
@@ -241,8 +309,8 @@ class KISCollector(BaseCollector):
             if not self.rate_limiter.wait():
                 return None
             
-            response = requests.get(url, headers=headers, params=params, timeout=30)
-            data = response.json()
+            response = self._session.get(url, headers=headers, params=params, timeout=30)
+            data = json_loads(response.content)
             
             if data.get('rt_cd') == '0':
                 return data.get('output', {})
@@ -252,6 +320,53 @@ class KISCollector(BaseCollector):
             self.logger.error(f"종목 정보 조회 실패 [{stock_code}]: {e}")
             return None
     
+    @retry(max_attempts=3, delay=1.0)
+    def get_multiple_prices(self, stock_codes: List[str]) -> Optional[List[Dict]]:
+        """
+        여러 종목 현재가 한 번에 조회 (관심종목 멀티종목 시세, 최대 MULTI_PRICE_MAX개)
+        
+        Args:
+            stock_codes: 종목코드 리스트 (6자리)
+        
+        Returns:
+            종목별 시세 dict 리스트, 실패 시 None
+            (필드명은 get_current_price와 같게 변환, 종목코드가 없는 행은 제외하고 stock_code 추가)
+        """
+        if len(stock_codes) > self.MULTI_PRICE_MAX:
+            raise ValueError(f"한 번에 최대 {self.MULTI_PRICE_MAX}개 종목까지 조회 가능")
+        
+        url = f"{self.BASE_URL}/uapi/domestic-stock/v1/quotations/intstock-multprice"
+        headers = self._get_headers("FHKST11300006")
+        params = {}
+        for i, code in enumerate(stock_codes, 1):
+            params[f"FID_COND_MRKT_DIV_CODE_{i}"] = "J"
+            params[f"FID_INPUT_ISCD_{i}"] = code
+        
+        try:
+            if not self.rate_limiter.wait():
+                raise Exception("일일 호출 한도 초과")
+            
+            response = self._session.get(url, headers=headers, params=params, timeout=30)
+            data = json_loads(response.content)
+            
+            if data.get('rt_cd') == '0':
+                rows = []
+                for row in data.get('output') or []:
+                    code = (row.get('inter_shrn_iscd') or '').strip()
+                    if not code:
+                        continue
+                    row = {self.MULTI_PRICE_FIELDS.get(k, k): v for k, v in row.items()}
+                    row['stock_code'] = code
+                    rows.append(row)
+                return rows
+            
+            self.logger.warning(f"멀티종목 시세 조회 실패: {data.get('msg1')}")
+            return None
+        
+        except Exception as e:
+            self.logger.error(f"멀티종목 시세 조회 실패: {e}")
+            return None
+    
     def collect_batch_prices(
         self,
         stock_codes: List[str]
@@ -259,19 +374,30 @@ class KISCollector(BaseCollector):
         """
         다수 종목 현재가 일괄 조회
         
+        MULTI_PRICE_MAX개씩 멀티종목 시세로 묶어 조회한다 (호출 수 1/30).
+        한 종목만 남은 묶음, 멀티종목 조회가 실패한 묶음, 응답에 빠진 종목은
+        종목별 현재가 조회로 대체한다.
+        
         ⚠️ Rate limit 주의: 분당 20건
         """
         all_data = []
         total = len(stock_codes)
         
-        for i, code in enumerate(stock_codes):
-            if (i + 1) % 10 == 0:
-                self.logger.info(f"현재가 조회 진행: {i+1}/{total}")
+        for start in range(0, total, self.MULTI_PRICE_MAX):
+            chunk = stock_codes[start:start + self.MULTI_PRICE_MAX]
+            self.logger.info(f"현재가 조회 진행: {start + len(chunk)}/{total}")
+            
+            rows = self.get_multiple_prices(chunk) if len(chunk) > 1 else None
+            if rows is not None:
+                all_data.extend(rows)
+                returned = {row['stock_code'] for row in rows}
+                chunk = [code for code in chunk if code not in returned]
             
-            price_info = self.get_current_price(code)
-            if price_info:
-                price_info['stock_code'] = code
-                all_data.append(price_info)
+            for code in chunk:
+                price_info = self.get_current_price(code)
+                if price_info:
+                    price_info['stock_code'] = code
+                    all_data.append(price_info)
         
         if not all_data:
             return pd.DataFrame()
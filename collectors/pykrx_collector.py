@@ -25,6 +25,8 @@ class PyKrxCollector(BaseCollector):
         'KOSDAQ150': '2203'
     }
     
+    OHLC_COLUMNS = ['open', 'high', 'low', 'close']
+    
     def __init__(self, cache_dir: str = "cache"):
         super().__init__(
             name="pykrx",
@@ -34,6 +36,19 @@ class PyKrxCollector(BaseCollector):
         )
         self._valid_date = None  # 캐시
     
+    @classmethod
+    def _is_closed_day(cls, df: pd.DataFrame) -> bool:
+        """
+        휴장일 시세 여부
+        
+        평일 휴장일(설날, 추석, 선거일 등)에 get_market_ohlcv는 빈 결과가 아니라
+        전 종목을 시가/고가/저가/종가 모두 0으로 반환한다.
+        """
+        if df.empty:
+            return True
+        cols = [c for c in cls.OHLC_COLUMNS if c in df.columns]
+        return bool(cols) and bool((df[cols] == 0).all(axis=None))
+    
     def _find_recent_trading_date(self) -> str:
         """pykrx에서 가장 최근 거래일 자동 조회"""
         if self._valid_date:
@@ -111,6 +126,11 @@ class PyKrxCollector(BaseCollector):
             df = df.rename(columns={k: v for k, v in rename_map.items() if k in df.columns})
             df['date'] = date
             
+            if self._is_closed_day(df):
+                # 휴장일의 0원 시세는 캐시하지 않음
+                self.logger.warning(f"휴장일 시세 (전 종목 0원): {date}")
+                return pd.DataFrame()
+            
             self._save_to_cache(cache_key, df.to_dict('records'))
             self.logger.info(f"{date} 시세 {len(df)}개 종목 조회")
             
@@ -120,6 +140,49 @@ class PyKrxCollector(BaseCollector):
             self.logger.error(f"시세 조회 실패 [{date}]: {e}")
             return pd.DataFrame()
     
+    def get_ohlcv_range(
+        self,
+        start: str,
+        end: str = None,
+        market: str = "ALL",
+        stock_codes: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        기간 전 종목 시세 조회 (일자별 전 종목 스냅샷)
+        
+        종목별로 기간 시세를 요청하는 대신 영업일마다 전 종목 시세를 한 번씩 조회한다.
+        요청 수가 (종목수)에서 (영업일수)로 줄어든다 (예: 2,000종목 × 1년 → 약 250회).
+        휴장일(빈 결과 또는 전 종목 0원 시세)은 건너뛴다.
+        
+        Args:
+            start: 시작일 (YYYY-MM-DD 또는 YYYYMMDD)
+            end: 종료일 (None이면 오늘)
+            market: 'ALL', 'KOSPI', 'KOSDAQ', 'KONEX'
+            stock_codes: 지정 시 해당 종목만 반환
+        
+        Returns:
+            종목별 일봉 DataFrame (stock_code, date, open, high, low, close, volume, ...)
+        """
+        if end is None:
+            end = datetime.now().strftime('%Y%m%d')
+        
+        frames = []
+        for day in pd.bdate_range(start.replace('-', ''), end.replace('-', '')):
+            df = self.get_market_ohlcv(day.strftime('%Y%m%d'), market=market)
+            if not self._is_closed_day(df):
+                frames.append(df)
+        
+        if not frames:
+            return pd.DataFrame()
+        
+        result = pd.concat(frames, ignore_index=True)
+        if stock_codes is not None:
+            result = result[result['stock_code'].isin(stock_codes)].reset_index(drop=True)
+        result['date'] = pd.to_datetime(result['date'], format='%Y%m%d')
+        
+        self.logger.info(f"기간 시세 {len(frames)}일, {len(result)}행 조회")
+        return result
+    
     def get_market_fundamental(self, date: str = None, market: str = "ALL") -> pd.DataFrame:
         """전 종목 투자지표 조회"""
         date = self._get_valid_date(date)
@@ -146,6 +209,11 @@ class PyKrxCollector(BaseCollector):
             df = df.rename(columns={k: v for k, v in rename_map.items() if k in df.columns})
             df['date'] = date
             
+            if self._is_closed_day(df):
+                # 휴장일의 0원 시세는 캐시하지 않음
+                self.logger.warning(f"휴장일 시세 (전 종목 0원): {date}")
+                return pd.DataFrame()
+            
             self._save_to_cache(cache_key, df.to_dict('records'))
             self.logger.info(f"{date} 투자지표 {len(df)}개 종목 조회")
             
@@ -180,6 +248,11 @@ class PyKrxCollector(BaseCollector):
             df = df.rename(columns={k: v for k, v in rename_map.items() if k in df.columns})
             df['date'] = date
             
+            if self._is_closed_day(df):
+                # 휴장일의 0원 시세는 캐시하지 않음
+                self.logger.warning(f"휴장일 시세 (전 종목 0원): {date}")
+                return pd.DataFrame()
+            
             self._save_to_cache(cache_key, df.to_dict('records'))
             return df
             
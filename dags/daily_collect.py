@@ -33,10 +33,10 @@ dag = DAG(
 def collect_daily_prices(**context):
     """일간 주가 수집"""
     from collectors.async_price import collect_all_marketcap
-    import asyncio
+    from collectors.async_base import run_async
     
     print("📈 일간 주가 수집 시작...")
-    df = asyncio.run(collect_all_marketcap())
+    df = run_async(collect_all_marketcap())
     print(f"✓ {len(df)}개 종목 수집 완료")
     
     # XCom으로 결과 전달
@@ -183,27 +183,28 @@ class DataCleaner:
     def clean_macro_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         거시경제 지표 정제
+        
+        수집기가 이미 숫자/날짜 타입으로 만든 컬럼은 다시 변환하지 않고,
+        변환이 필요한 컬럼만 모아 assign으로 한 번에 교체한다 (전체 복사 없음).
         """
         if df.empty:
             return df
         
-        df = df.copy()
+        updates = {}
         
         # 값 숫자 변환
-        if 'DATA_VALUE' in df.columns:
-            df['DATA_VALUE'] = pd.to_numeric(df['DATA_VALUE'], errors='coerce')
-        
-        if 'value' in df.columns:
-            df['value'] = pd.to_numeric(df['value'], errors='coerce')
+        for col in ('DATA_VALUE', 'value'):
+            if col in df.columns and not pd.api.types.is_numeric_dtype(df[col]):
+                updates[col] = pd.to_numeric(df[col], errors='coerce')
         
         # 날짜 변환
         if 'TIME' in df.columns:
-            df['TIME'] = df['TIME'].astype(str)
+            updates['TIME'] = df['TIME'].astype(str)
         
-        if 'date' in df.columns:
-            df['date'] = pd.to_datetime(df['date'], errors='coerce')
+        if 'date' in df.columns and not pd.api.types.is_datetime64_any_dtype(df['date']):
+            updates['date'] = pd.to_datetime(df['date'], errors='coerce')
         
-        return df
+        return df.assign(**updates)
     
     def remove_outliers(
         self,
@@ -3,15 +3,19 @@
 """
 
 from .logger import setup_logger, get_logger
-from .rate_limiter import rate_limit, RateLimiter
+from .rate_limiter import rate_limit, RateLimiter, TokenBucket
 from .setup_checker import SetupChecker, ensure_dependencies
 from .progress_tracker import ProgressTracker, create_progress_callback
+from .jit import njit, prange, HAS_NUMBA
+from .json_codec import json_dumps, json_loads, HAS_ORJSON
 
 __all__ = [
     'setup_logger', 'get_logger',
-    'rate_limit', 'RateLimiter',
+    'rate_limit', 'RateLimiter', 'TokenBucket',
     'SetupChecker', 'ensure_dependencies',
-    'ProgressTracker', 'create_progress_callback'
+    'ProgressTracker', 'create_progress_callback',
+    'njit', 'prange', 'HAS_NUMBA',
+    'json_dumps', 'json_loads', 'HAS_ORJSON'
 ]
 
 
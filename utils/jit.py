@@ -0,0 +1,21 @@
+"""
+Numba JIT 호환 모듈
+- numba 설치 시 njit/prange를 그대로 사용
+- 미설치 시 데코레이터를 무시하고 순수 파이썬으로 동작
+"""
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """numba 미설치 시 원본 함수를 그대로 반환"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        
+        def decorator(func):
+            return func
+        return decorator
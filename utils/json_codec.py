@@ -0,0 +1,41 @@
+"""
+JSON 직렬화 모듈
+- orjson 설치 시 orjson 사용 (bytes 직접 출력, 3~10배 빠름)
+- 미설치 시 표준 json 모듈로 동작
+- json_response: API 라우터용 JSON 응답 (fastapi 필요, 호출 시점에 import)
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+    HAS_ORJSON = True
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+except ImportError:
+    HAS_ORJSON = False
+
+
+def json_dumps(obj: Any) -> bytes:
+    """객체 → UTF-8 JSON bytes"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+
+def json_loads(data: Union[bytes, bytearray, str]) -> Any:
+    """JSON bytes/str → 객체"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_response(obj: Any) -> 'Response':
+    """
+    객체 → JSON 응답 (FastAPI 라우터용)
+    
+    pydantic 검증/변환 없이 바로 직렬화하므로 response_model 스키마는 문서화에만 쓰인다.
+    호출자가 모델 필드로 미리 맞춘 데이터를 넘겨야 한다.
+    """
+    from fastapi import Response
+    return Response(content=json_dumps(obj), media_type="application/json")
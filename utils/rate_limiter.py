@@ -2,13 +2,13 @@
 API 호출 속도 제한 모듈
 - 데코레이터 기반 rate limiting
 - 클래스 기반 rate limiter
+- 토큰 버킷
 """
 
 import time
 import threading
 from functools import wraps
-from typing import Callable, Any
-from collections import deque
+from typing import Callable, Any, Optional
 
 
 def rate_limit(calls_per_minute: int = 100) -> Callable:
@@ -44,24 +44,74 @@ def rate_limit(calls_per_minute: int = 100) -> Callable:
     return decorator
 
 
+class TokenBucket:
+    """
+    토큰 버킷 (스레드 안전)
+    
+    초당 rate개씩 토큰이 채워지고 최대 capacity개까지 쌓인다. 토큰이 남아 있으면 바로 통과하고,
+    부족할 때만 채워질 때까지 대기한다. 대기 시간은 락 안에서 예약(토큰을 음수로 차감)하고
+    sleep은 락 밖에서 하므로, 여러 스레드가 서로의 대기를 직렬로 기다리지 않는다.
+    """
+    
+    def __init__(self, rate: float, per: float = 1.0, capacity: Optional[float] = None):
+        """
+        Args:
+            rate: per초 동안 허용할 호출 수
+            per: 기준 시간 (초)
+            capacity: 최대 버스트 (None이면 1초 분량, 최소 1)
+        """
+        self.rate = rate / per
+        self.capacity = capacity if capacity is not None else max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        토큰 획득 (부족하면 대기)
+        
+        Returns:
+            대기한 시간 (초)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            wait_time = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        
+        if wait_time > 0:
+            time.sleep(wait_time)
+        return wait_time
+    
+    def reset(self) -> None:
+        """버킷을 가득 채움"""
+        with self._lock:
+            self._tokens = self.capacity
+            self._updated = time.monotonic()
+
+
 class RateLimiter:
     """
-    슬라이딩 윈도우 기반 Rate Limiter
+    토큰 버킷 기반 Rate Limiter
     
-    분당 호출 횟수를 제한하며, 호출 이력을 관리
+    분당 호출 속도와 일일 호출 횟수를 제한한다. 기본값은 호출 간 min_interval 간격을
+    지키며, burst를 지정한 경우에만 그만큼 대기 없이 연속 호출을 허용한다.
     """
     
-    def __init__(self, calls_per_minute: int = 100, daily_limit: int = 10000):
+    def __init__(self, calls_per_minute: int = 100, daily_limit: int = 10000, burst: Optional[float] = None):
         """
         Args:
             calls_per_minute: 분당 최대 호출 횟수
             daily_limit: 일일 최대 호출 횟수
+            burst: 대기 없이 연속 허용할 호출 수 (None이면 1 - min_interval 간격 유지)
         """
         self.calls_per_minute = calls_per_minute
         self.daily_limit = daily_limit
         self.min_interval = 60.0 / calls_per_minute
         
-        self.call_times: deque = deque()
+        # min_interval마다 토큰 1개 충전
+        self.bucket = TokenBucket(1.0, self.min_interval, burst if burst is not None else 1.0)
         self.daily_count = 0
         self.daily_reset_time = time.time()
         
@@ -86,28 +136,11 @@ class RateLimiter:
             if self.daily_count >= self.daily_limit:
                 return False
             
-            # 1분 윈도우 밖의 호출 제거
-            window_start = current_time - 60.0
-            while self.call_times and self.call_times[0] < window_start:
-                self.call_times.popleft()
-            
-            # 분당 한도 체크 및 대기
-            if len(self.call_times) >= self.calls_per_minute:
-                wait_time = self.call_times[0] + 60.0 - current_time
-                if wait_time > 0:
-                    time.sleep(wait_time)
-            
-            # 최소 간격 대기
-            if self.call_times:
-                elapsed = current_time - self.call_times[-1]
-                if elapsed < self.min_interval:
-                    time.sleep(self.min_interval - elapsed)
-            
-            # 호출 기록
-            self.call_times.append(time.time())
             self.daily_count += 1
-            
-            return True
+        
+        # 속도 제한 (락 밖에서 대기)
+        self.bucket.acquire()
+        return True
     
     def get_remaining_daily_calls(self) -> int:
         """남은 일일 호출 횟수 반환"""
@@ -116,6 +149,6 @@ class RateLimiter:
     def reset(self) -> None:
         """카운터 리셋"""
         with self._lock:
-            self.call_times.clear()
+            self.bucket.reset()
             self.daily_count = 0
             self.daily_reset_time = time.time()